@@ -1,42 +1,34 @@
 """
-main.py — Full scraping pipeline:
+main.py — Full scraping pipeline (CarTrade and CarDekho scraping run in parallel):
 CarTrade:
 1. Fetch all live events
 2. Filter insurance events
 3. Fetch auction details for filtered ones
-4. Download GJ images and metadata
 
 CarDekho:
 1. Fetch dashboard data
 2. Filter insurance business data
 3. Extract vehicle data and images
-4. Download images and create metadata
 
-Both:
+Both (one after the other, CarTrade first):
+4. Download images and create metadata
 5. Create zip archive
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from scraper.events_scraper import fetch_live_events, filter_insurance_events
 from scraper.auction_details_scraper import fetch_auction_details
 from scraper.download_gj_images import download_gj_images
 from scraper.download_gj_images import create_date_zip
 from scraper.cardekho_events_scraper import fetch_cardekho_dashboard_data, filter_insurance_business
 from scraper.cardekho_vehicle_scraper import update_auction_paths_with_vehicles, download_cardekho_images
+from scraper.log_setup import configure_logging
 from dotenv import load_dotenv
 import os
 
-def main():
-    load_dotenv()
-    name = os.getenv("SCRAPER_NAME", "User")
-    date = os.getenv("SCRAPE_START_DATE", "Unknown")
-
-    logging.info("=" * 60)
-    logging.info("🚀 Web Scraping Pipeline Starting")
-    logging.info("=" * 60)
-    logging.info("👋 Hello %s, scraping started on %s", name, date)
-
-    # ========== CarTrade Scraping ==========
+def run_cartrade():
+    """CarTrade scraping: events → insurance filter → auction details."""
     logging.info("")
     logging.info("=" * 60)
     logging.info("📊 CARTRADE SCRAPING")
@@ -54,12 +46,12 @@ def main():
 
     logging.info("Starting detailed auction scraping...")
     fetch_auction_details()
-    # After fetching auction details
-    download_gj_images()
 
     logging.info("✅ CarTrade scraping completed successfully!")
+    return True
 
-    # ========== CarDekho Scraping ==========
+def run_cardekho():
+    """CarDekho scraping: dashboard → insurance filter → vehicles."""
     logging.info("")
     logging.info("=" * 60)
     logging.info("📊 CARDEKHO SCRAPING")
@@ -83,7 +75,11 @@ def main():
             logging.warning("⚠️  Vehicle link extraction had errors, but continuing...")
         else:
             logging.info("✅ CarDekho vehicle link extraction completed successfully!")
-    
+
+    return True
+
+def download_cardekho():
+    """CarDekho downloads: vehicle images and metadata."""
     # Step 4: Download images and create metadata
     logging.info("")
     logging.info("=" * 60)
@@ -94,6 +90,46 @@ def main():
         logging.warning("⚠️  CarDekho image download had errors, but continuing...")
     else:
         logging.info("✅ CarDekho image download completed successfully!")
+
+    return True
+
+def main():
+    load_dotenv()
+    configure_logging()
+    name = os.getenv("SCRAPER_NAME", "User")
+    date = os.getenv("SCRAPE_START_DATE", "Unknown")
+
+    logging.info("=" * 60)
+    logging.info("🚀 Web Scraping Pipeline Starting")
+    logging.info("=" * 60)
+    logging.info("👋 Hello %s, scraping started on %s", name, date)
+
+    # CarTrade and CarDekho scraping hit different hosts and write different
+    # files, so run both side by side and overlap their network waits
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            executor.submit(run_cartrade): "CarTrade",
+            executor.submit(run_cardekho): "CarDekho",
+        }
+        results = {}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results[source] = future.result()
+            except Exception as e:
+                logging.exception(f"💥 {source} pipeline crashed: {e}")
+                results[source] = False
+            logging.info(f"🏁 {source} pipeline finished: {'✅ OK' if results[source] else '❌ FAILED'}")
+
+    # Both downloaders write downloads/<date>/<REG_NO>/, so run them one
+    # after the other in the original order: CarTrade first, then CarDekho
+    if results["CarTrade"]:
+        download_gj_images()
+    if results["CarDekho"]:
+        download_cardekho()
+
+    if not all(results.values()):
+        return False
     
     # Step 5: Create zip archive (for both CarTrade and CarDekho)
     logging.info("")
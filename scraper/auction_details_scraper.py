@@ -8,28 +8,35 @@ Also filters data by registration number prefix ("GJ").
 
 import os
 import re
-import json
-import time
+import shutil
+import hashlib
 import logging
 import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from scraper.log_setup import configure_logging
+from scraper.session import build_session
+from scraper.json_io import read_json, write_json, read_json_lines, write_json_lines
+from scraper.rate_limiter import RateLimiter
 
 BASE_PAGE_URL = "https://www.cartradeexchange.com"
 POST_URL = "https://www.cartradeexchange.com/auctions-live/"
 
+# Events per batch; each batch is saved to its own part file so an
+# interrupted run can resume without refetching finished batches
+BATCH_SIZE = 25
+PARTS_DIR = "downloads/cartrade_auction_details_parts"
+# Identifies the run (bid paths + date) the part files belong to
+PARTS_MANIFEST = os.path.join(PARTS_DIR, "manifest.json")
 
-def setup_logger():
-    os.makedirs("logs", exist_ok=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)s | %(message)s",
-        handlers=[
-            logging.FileHandler("logs/scraper.log", encoding="utf-8"),
-            logging.StreamHandler()
-        ],
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+# Matches :param1="..." on the <Bidnowpopup> component
+PK1_RE = re.compile(r':param1="([^"]+)"')
+PK1_BYTES_RE = re.compile(rb':param1="([^"]+)"')
+# Cheap check for the component before paying for a full HTML parse
+BIDNOWPOPUP_RE = re.compile(r'<bidnowpopup\b', re.IGNORECASE)
+# After pk1 is found, read up to this many more bytes to keep the connection reusable
+DRAIN_LIMIT = 64 * 1024
 
 
 def extract_pk1_from_html(html_text):
@@ -39,12 +46,16 @@ def extract_pk1_from_html(html_text):
         <Bidnowpopup ... :param1="encoded_value" ... />
     """
     # Try regex first
-    pk1_match = re.search(r':param1="([^"]+)"', html_text)
+    pk1_match = PK1_RE.search(html_text)
     if pk1_match:
         return pk1_match.group(1)
 
+    # No <Bidnowpopup> tag at all -> nothing for the parser to find
+    if not BIDNOWPOPUP_RE.search(html_text):
+        return None
+
     # Fallback using BeautifulSoup if the HTML is rendered differently
-    soup = BeautifulSoup(html_text, "html.parser")
+    soup = BeautifulSoup(html_text, "lxml")
     bid_popup = soup.find("bidnowpopup")
     if bid_popup:
         return bid_popup.get(":param1") or bid_popup.get("param1")
@@ -52,13 +63,236 @@ def extract_pk1_from_html(html_text):
     return None
 
 
+def read_pk1_from_response(response, chunk_size=8192):
+    """
+    Reads a streamed auction page only until the :param1 attribute shows up,
+    so the rest of the page is never downloaded. Falls back to
+    extract_pk1_from_html on the full body if the regex never matches.
+    """
+    buf = bytearray()
+    chunks = response.iter_content(chunk_size)
+    for chunk in chunks:
+        # Rescan a small overlap so a match split across chunks is still found
+        start = max(0, len(buf) - 512)
+        buf += chunk
+        pk1_match = PK1_BYTES_RE.search(buf, start)
+        if pk1_match:
+            drain_response(chunks)
+            return pk1_match.group(1).decode("utf-8", errors="replace")
+
+    return extract_pk1_from_html(buf.decode(response.encoding or "utf-8", errors="replace"))
+
+
+def drain_response(chunks, limit=DRAIN_LIMIT):
+    """
+    Reads (and discards) a small remaining body so the keep-alive connection
+    goes back to the pool instead of being closed, which would cost a new
+    TCP + TLS handshake on the next request. Large remainders are abandoned.
+    """
+    drained = 0
+    for chunk in chunks:
+        drained += len(chunk)
+        if drained > limit:
+            return
+
+
+def fetch_event_pk1(i, entry, session, total, limiter=None):
+    """
+    Stage 1: fetches the auction page for one bid path and extracts pk1.
+    Returns pk1, or None on failure.
+    """
+    event_id = entry.get("eventId")
+    bid_path = entry.get("bidNowPath")
+
+    if not event_id or not bid_path:
+        logging.warning("Skipping invalid entry: %s", entry)
+        return None
+
+    full_url = BASE_PAGE_URL + bid_path
+    logging.info(f"[{i}/{total}] Fetching HTML for event {event_id}...")
+
+    try:
+        if limiter:
+            limiter.acquire()
+        with session.get(full_url, timeout=20, stream=True) as page_resp:
+            page_resp.raise_for_status()
+
+            # Extract pk1 from page HTML (stops reading once found)
+            pk1 = read_pk1_from_response(page_resp)
+        if not pk1:
+            logging.warning(f"Could not extract pk1 for event {event_id}")
+        return pk1
+
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Network error or cookie expired for {event_id}: {e}")
+    except Exception as e:
+        logging.exception(f"Unexpected error for {event_id}: {e}")
+
+    return None
+
+
+def post_event_details(event_id, pk1, session, limiter=None):
+    """
+    Stage 2: builds the dynamic payload from pk1 and posts the auction-live
+    request. Returns the result record, or None on failure.
+    """
+    pk2 = "10" + str(event_id)
+    payload = {
+        "vue_action": "getAuctionEvents_new",
+        "pk1": pk1,
+        "pk2": pk2,
+        "show": "active",
+        "vue_event_id": event_id
+    }
+
+    try:
+        logging.info(f"Posting auction-live request for event {event_id}...")
+        if limiter:
+            limiter.acquire()
+        post_resp = session.post(POST_URL, json=payload, timeout=25)
+        post_resp.raise_for_status()
+
+        data = post_resp.json()
+
+        # Determine the number of auction items
+        auction_count = len(data.get("auctionList", []))
+
+        logging.info(f"✅ Success for event {event_id} | Received {auction_count} auction items")
+
+        return {
+            "eventId": event_id,
+            "pk1": pk1,
+            "pk2": pk2,
+            "auctionCount": auction_count,
+            "response": data
+        }
+
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Network error or cookie expired for {event_id}: {e}")
+    except Exception as e:
+        logging.exception(f"Unexpected error for {event_id}: {e}")
+
+    return None
+
+
+def process_batch(batch, session, page_pool, post_pool, total, limiter=None):
+    """
+    Runs one batch through the two-stage pipeline: each page fetch hands its
+    pk1 to the POST pool as soon as it completes, so POSTs overlap with the
+    remaining page fetches. Returns the successful records in batch order.
+    """
+    page_futures = {
+        page_pool.submit(fetch_event_pk1, i, entry, session, total, limiter): (i, entry)
+        for i, entry in batch
+    }
+    post_futures = {}
+    for future in as_completed(page_futures):
+        pk1 = future.result()
+        if pk1:
+            i, entry = page_futures[future]
+            post_futures[i] = post_pool.submit(post_event_details, entry.get("eventId"), pk1, session, limiter)
+
+    records = (post_futures[i].result() for i, _ in batch if i in post_futures)
+    return [record for record in records if record]
+
+
+def part_files(parts_dir):
+    """Sorted paths of the batch part files in parts_dir."""
+    return sorted(
+        entry.path for entry in os.scandir(parts_dir)
+        if entry.name.startswith("part") and entry.name.endswith(".jsonl")
+    )
+
+
+def next_part_index(parts_dir):
+    """Index for the next part file (after any left over from an interrupted run)."""
+    names = [os.path.basename(path) for path in part_files(parts_dir)]
+    return max((int(name[4:8]) for name in names), default=-1) + 1
+
+
+def prepare_parts_dir(run_key):
+    """
+    Makes sure PARTS_DIR only holds parts from the run identified by run_key.
+    Parts left by a different run (other bid paths or date) are discarded, so
+    their stale responses are never resumed from or merged.
+    """
+    if os.path.exists(PARTS_MANIFEST):
+        try:
+            manifest = read_json(PARTS_MANIFEST)
+        except Exception:
+            manifest = {}
+        if manifest.get("run_key") == run_key:
+            return
+    if os.path.isdir(PARTS_DIR) and part_files(PARTS_DIR):
+        logging.info("🧹 Discarding part files from a different run")
+    shutil.rmtree(PARTS_DIR, ignore_errors=True)
+    os.makedirs(PARTS_DIR, exist_ok=True)
+    write_json(PARTS_MANIFEST, {"run_key": run_key})
+
+
+def load_completed_event_ids(parts_dir):
+    """Event IDs already saved in part files."""
+    return {
+        str(record.get("eventId"))
+        for path in part_files(parts_dir)
+        for _, record in read_json_lines(path)
+    }
+
+
+def save_auction_outputs(bid_paths):
+    """
+    Merges the batch part files into cartrade_auction_details_full.jsonl,
+    writes the GJ-filtered vehicles to cartrade_vehicles_gujarat.json,
+    then removes the part files.
+    Only events from the current bid_paths are kept (stale parts are ignored).
+    """
+    all_file = "downloads/cartrade_auction_details_full.jsonl"
+    gj_file = "downloads/cartrade_vehicles_gujarat.json"
+
+    current_ids = {str(entry.get("eventId")) for entry in bid_paths}
+    written_ids = set()
+    seen_vehicles = set()  # (eventId, registrationNumber) already added
+    gj_filtered = []
+
+    with open(all_file, "wb", buffering=1 << 20) as all_f:
+        for path in part_files(PARTS_DIR):
+            for line, record in read_json_lines(path):
+                event_id = str(record.get("eventId"))
+                if event_id not in current_ids or event_id in written_ids:
+                    continue
+                written_ids.add(event_id)
+                all_f.write(line)
+
+                # Filter for GJ registration numbers; a malformed record only
+                # costs that event, never the whole merge
+                try:
+                    for auction in record["response"].get("auctionList", []):
+                        reg_no = auction.get("registrationNumber") or ""
+                        if not reg_no.startswith("GJ"):
+                            continue
+                        key = (event_id, reg_no)
+                        if key in seen_vehicles:
+                            continue
+                        seen_vehicles.add(key)
+                        gj_filtered.append(auction)
+                except Exception as e:
+                    logging.warning(f"Skipping GJ filter for event {event_id} due to malformed record: {e}")
+
+    # GJ subset stays a JSON array (read back by download_gj_images)
+    write_json(gj_file, gj_filtered)
+    shutil.rmtree(PARTS_DIR, ignore_errors=True)
+
+    logging.info(f"💾 Saved {len(written_ids)} full auction responses → {all_file}")
+    logging.info(f"💾 Saved {len(gj_filtered)} filtered GJ auctions → {gj_file}")
+
+
 def fetch_auction_details():
     """
-    Fetches detailed auction data for each bidNowPath,
-    saves full JSON, and filtered GJ JSON.
+    Fetches detailed auction data for each bidNowPath in batches,
+    saves full responses as JSON Lines, and saves filtered GJ JSON.
     """
     load_dotenv()
-    setup_logger()
+    configure_logging()
 
     cookie = os.getenv("CAR_TRADE_COOKIE")
     if not cookie:
@@ -69,8 +303,12 @@ def fetch_auction_details():
         logging.error("Missing cartrade_event_paths.json — run previous stage first.")
         return
 
-    with open(bid_path_file, "r", encoding="utf-8") as f:
-        bid_paths = json.load(f)
+    bid_paths = read_json(bid_path_file)
+    # Ties resumable part files to this exact set of bid paths and date
+    with open(bid_path_file, "rb") as f:
+        run_hash = hashlib.sha256(f.read())
+    run_hash.update((os.getenv("SCRAPE_START_DATE") or "").encode())
+    run_key = run_hash.hexdigest()
 
     headers = {
         "Content-Type": "application/json",
@@ -83,89 +321,45 @@ def fetch_auction_details():
         "Referer": "https://www.cartradeexchange.com/Events-Live"
     }
 
-    all_results = []
-    gj_filtered = []
-
     total = len(bid_paths)
-    logging.info(f"Found {total} auction bid paths to process...")
-
-    for i, entry in enumerate(bid_paths, 1):
-        event_id = entry.get("eventId")
-        bid_path = entry.get("bidNowPath")
-
-        if not event_id or not bid_path:
-            logging.warning("Skipping invalid entry: %s", entry)
-            continue
-
-        full_url = BASE_PAGE_URL + bid_path
-        logging.info(f"[{i}/{total}] Fetching HTML for event {event_id}...")
-
-        try:
-            # Step 1: Fetch auction page
-            page_resp = requests.get(full_url, headers=headers, timeout=20)
-            page_resp.raise_for_status()
-
-            # Step 2: Extract pk1 from page HTML
-            pk1 = extract_pk1_from_html(page_resp.text)
-            if not pk1:
-                logging.warning(f"Could not extract pk1 for event {event_id}")
-                continue
-
-            # Step 3: Build dynamic payload
-            pk2 = "10" + str(event_id)
-            payload = {
-                "vue_action": "getAuctionEvents_new",
-                "pk1": pk1,
-                "pk2": pk2,
-                "show": "active",
-                "vue_event_id": event_id
-            }
-
-            logging.info(f"Posting auction-live request for event {event_id}...")
-            post_resp = requests.post(POST_URL, json=payload, headers=headers, timeout=25)
-            post_resp.raise_for_status()
-
-            data = post_resp.json()
-
-            # Determine the number of auction items
-            auction_list = data.get("auctionList", [])
-            auction_count = len(auction_list)
-
-            logging.info(f"✅ Success for event {event_id} | Received {auction_count} auction items")
-
-            all_results.append({
-                "eventId": event_id,
-                "pk1": pk1,
-                "pk2": pk2,
-                "auctionCount": auction_count,
-                "response": data
-            })
-
-            # Step 4: Filter for GJ registration numbers
-            for auction in auction_list:
-                reg_no = auction.get("registrationNumber", "")
-                if reg_no.startswith("GJ"):
-                    gj_filtered.append(auction)
-
-            # Be polite with requests
-            time.sleep(2)
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Network error or cookie expired for {event_id}: {e}")
-        except Exception as e:
-            logging.exception(f"Unexpected error for {event_id}: {e}")
-
-    # Save outputs
-    os.makedirs("downloads", exist_ok=True)
-
-    all_file = "downloads/cartrade_auction_details_full.json"
-    with open(all_file, "w", encoding="utf-8") as f:
-        json.dump(all_results, f, indent=4, ensure_ascii=False)
-
-    gj_file = "downloads/cartrade_vehicles_gujarat.json"
-    with open(gj_file, "w", encoding="utf-8") as f:
-        json.dump(gj_filtered, f, indent=4, ensure_ascii=False)
-
-    logging.info(f"💾 Saved {len(all_results)} full auction responses → {all_file}")
-    logging.info(f"💾 Saved {len(gj_filtered)} filtered GJ auctions → {gj_file}")
+    concurrency = max(1, int(os.getenv("SCRAPE_CONCURRENCY", 8)))
+    post_concurrency = max(1, int(os.getenv("SCRAPE_POST_CONCURRENCY", concurrency)))
+    # Be polite with requests: pace GETs + POSTs across all workers
+    limiter = RateLimiter(float(os.getenv("SCRAPE_RATE_LIMIT", 5)))
+    logging.info(f"Found {total} auction bid paths to process (concurrency={concurrency}/{post_concurrency})...")
+
+    prepare_parts_dir(run_key)
+
+    # Resume: events already saved in part files from an interrupted run of
+    # the same bid paths are skipped
+    done_ids = load_completed_event_ids(PARTS_DIR)
+    pending = [
+        (i, entry) for i, entry in enumerate(bid_paths, 1)
+        if str(entry.get("eventId")) not in done_ids
+    ]
+    if done_ids:
+        logging.info(f"⏩ Resuming: {total - len(pending)} events already saved, {len(pending)} remaining")
+
+    # Events are independent, so fetch them concurrently in two pipelined stages:
+    # page GETs (pk1) feed auction-live POSTs, each stage with its own worker pool.
+    # All workers share one pooled session so connections are reused.
+    # Each batch is flushed to its own part file so a crash only loses one batch.
+    # Optional on-disk cache for auction page GETs (HTTP_CACHE_TTL seconds, 0 = off).
+    # A cache miss stores the whole page, so it is downloaded in full rather than
+    # stopping at pk1; only re-runs within the TTL skip the page fetch entirely
+    cache_ttl = int(os.getenv("HTTP_CACHE_TTL", 0))
+    next_part = next_part_index(PARTS_DIR)
+    pool_size = concurrency + post_concurrency
+    with build_session(headers, pool_size=pool_size, cache_ttl=cache_ttl) as session, \
+            ThreadPoolExecutor(max_workers=concurrency) as page_pool, \
+            ThreadPoolExecutor(max_workers=post_concurrency) as post_pool:
+        for start in range(0, len(pending), BATCH_SIZE):
+            batch = pending[start:start + BATCH_SIZE]
+            records = process_batch(batch, session, page_pool, post_pool, total, limiter)
+            part_file = os.path.join(PARTS_DIR, f"part{next_part:04d}.jsonl")
+            write_json_lines(part_file, records)
+            next_part += 1
+            logging.info(f"💾 Batch saved ({min(start + BATCH_SIZE, len(pending))}/{len(pending)}) → {part_file}")
+
+    save_auction_outputs(bid_paths)
     logging.info("🎯 Auction detail scraping completed successfully.")
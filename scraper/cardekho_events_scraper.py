@@ -11,21 +11,13 @@ import json
 import logging
 import re
 import urllib.parse
+from functools import lru_cache
 import requests
 from datetime import datetime
 from dotenv import load_dotenv
-
-# === Logging Setup ===
-os.makedirs("logs", exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-    handlers=[
-        logging.FileHandler("logs/scraper.log", encoding="utf-8"),
-        logging.StreamHandler()
-    ],
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+from scraper.log_setup import configure_logging
+from scraper.session import build_session
+from scraper.json_io import read_json, write_json
 
 BASE_URL = "https://auctions.cardekho.com"
 
@@ -35,6 +27,15 @@ MONTH_ABBR = {
     'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
 }
 
+# Title date: 1-2 digits, 3 letter month, 2 digit year
+# Examples: "10Dec25", "5Jan25", "25Dec25"
+TITLE_DATE_RE = re.compile(r'(\d{1,2})(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(\d{2})', re.IGNORECASE)
+
+# Cookie fields used to build auth headers
+CONNECT_SID_RE = re.compile(r'connect\.sid=([^;]+)')
+SESSION_ID_RE = re.compile(r's:([^.]+)')
+GLOBALS_RE = re.compile(r'globals=([^;]+)')
+
 
 def parse_date_from_title(title):
     """
@@ -51,10 +52,7 @@ def parse_date_from_title(title):
     if not title:
         return None
     
-    # Regex pattern: 1-2 digits, 3 letter month, 2 digit year
-    # Examples: "10Dec25", "5Jan25", "25Dec25"
-    pattern = r'(\d{1,2})(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(\d{2})'
-    match = re.search(pattern, title, re.IGNORECASE)
+    match = TITLE_DATE_RE.search(title)
     
     if not match:
         return None
@@ -78,6 +76,26 @@ def parse_date_from_title(title):
         return None
 
 
+def title_date_hints(target_date):
+    """
+    Lowercase substrings a title must contain to carry target_date in dMMMyy
+    form, both unpadded and zero-padded (e.g. ("5dec25", "05dec25")).
+    A cheap `in` test on these rules out most titles before the regex runs.
+    
+    Args:
+        target_date (datetime.date): Date to look for
+        
+    Returns:
+        tuple: Candidate lowercase date strings
+    """
+    month_abbr = next(abbr for abbr, num in MONTH_ABBR.items() if num == target_date.month)
+    year_2digit = target_date.year % 100
+    return (
+        f"{target_date.day}{month_abbr}{year_2digit:02d}",
+        f"{target_date.day:02d}{month_abbr}{year_2digit:02d}",
+    )
+
+
 def extract_headers_from_cookie(cookie):
     """
     Extract additional headers from cookie string.
@@ -89,22 +107,29 @@ def extract_headers_from_cookie(cookie):
     Returns:
         dict: Additional headers dictionary with authorization, userid, parentuserid, associateclient
     """
+    # Parsing is memoized per cookie; hand each caller its own dict
+    return dict(_parse_cookie_headers(cookie))
+
+
+@lru_cache(maxsize=4)
+def _parse_cookie_headers(cookie):
+    """Parse auth headers out of the cookie string. Returns an immutable tuple of (name, value) pairs."""
     headers = {}
     
     # Extract Bearer token from connect.sid cookie
     # Format: connect.sid=s%3AUD-B4qkcyWQQ-JmRTDmghe2EzMEn7fHb.0g20rbI...
     # The session ID (UD-B4qkcyWQQ-JmRTDmghe2EzMEn7fHb) is the Bearer token
-    connect_sid_match = re.search(r'connect\.sid=([^;]+)', cookie)
+    connect_sid_match = CONNECT_SID_RE.search(cookie)
     if connect_sid_match:
         connect_sid_value = urllib.parse.unquote(connect_sid_match.group(1))
         # Extract session ID (format: s:UD-B4qkcyWQQ-JmRTDmghe2EzMEn7fHb.xxxxx)
-        session_match = re.search(r's:([^.]+)', connect_sid_value)
+        session_match = SESSION_ID_RE.search(connect_sid_value)
         if session_match:
             bearer_token = session_match.group(1)
             headers["Authorization"] = f"Bearer {bearer_token}"
     
     # Extract user info from globals cookie (JSON)
-    globals_match = re.search(r'globals=([^;]+)', cookie)
+    globals_match = GLOBALS_RE.search(cookie)
     if globals_match:
         try:
             globals_value = urllib.parse.unquote(globals_match.group(1))
@@ -130,7 +155,7 @@ def extract_headers_from_cookie(cookie):
         except (json.JSONDecodeError, KeyError) as e:
             logging.warning(f"⚠️  Could not parse globals cookie: {e}")
     
-    return headers
+    return tuple(headers.items())
 
 
 def fetch_cardekho_dashboard_data():
@@ -142,6 +167,7 @@ def fetch_cardekho_dashboard_data():
         str: Path to saved file, or None on error
     """
     load_dotenv()
+    configure_logging()
     cookie = os.getenv("CAR_DEKHO_COOKIE")
     if not cookie:
         logging.error("CAR_DEKHO_COOKIE not found in .env file")
@@ -191,7 +217,8 @@ def fetch_cardekho_dashboard_data():
     logging.info(f"   Payload: {payload}")
     
     try:
-        response = requests.post(api_url, json=payload, headers=headers, timeout=30)
+        with build_session(headers) as session:
+            response = session.post(api_url, json=payload, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -199,8 +226,7 @@ def fetch_cardekho_dashboard_data():
         os.makedirs("downloads", exist_ok=True)
         filename = "downloads/cardekho_dashboard_data.json"
         
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        write_json(filename, data)
         
         logging.info(f"✅ Saved dashboard data to {filename}")
         return filename
@@ -213,6 +239,74 @@ def fetch_cardekho_dashboard_data():
         return None
 
 
+def first_value(item, *keys, default=None):
+    """Return the first truthy value among item[keys], like a chain of `item.get(k) or ...`."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return default
+
+
+def build_auction_path(item, title):
+    """
+    Build the cardekho_auction_paths.json entry for one dashboard item.
+    
+    Args:
+        item (dict): Dashboard auction item
+        title (str): Auction title already resolved from the item
+        
+    Returns:
+        dict: Auction path entry with an empty vehicles list
+    """
+    slug = first_value(item, "slug", "auctionSlug", "url", default="")
+    # Extract slug from title if not present
+    # (e.g., "Gujarat PSU and Surveyor Vehicle 05Dec25" -> "Gujarat-PSU-and-Surveyor-Vehicle-05Dec25")
+    if not slug and title:
+        slug = title.replace(" ", "-").replace("/", "-")
+    
+    return {
+        "auction_id": first_value(item, "auctionId", "auction_id", "id"),
+        "title": title,
+        "slug": slug,
+        "vehicle_count": first_value(item, "vehicleCount", "totalVehicles", "count", "vehicle_count", default=0),
+        "vehicles": [],
+        "gj_vehicle_count": 0
+    }
+
+
+def save_parquet_copy(records, path):
+    """
+    Save records as a zstd-compressed Parquet file next to the JSON output,
+    for faster columnar loading in downstream analysis.
+    Optional: skipped if pyarrow is not installed or the records don't fit
+    a columnar schema (e.g. one key holding both numbers and strings).
+    
+    Args:
+        records (list): List of dicts
+        path (str): Output .parquet path
+        
+    Returns:
+        bool: True if the file was written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        logging.debug("pyarrow not installed, skipping Parquet output")
+        return False
+    
+    try:
+        # Union of keys across all rows (from_pylist would only use the first row's keys)
+        columns = dict.fromkeys(key for record in records for key in record)
+        table = pa.table({key: [record.get(key) for record in records] for key in columns})
+        pq.write_table(table, path, compression="zstd")
+        return True
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logging.warning(f"⚠️  Could not write Parquet copy {path}: {e}")
+        return False
+
+
 def filter_insurance_business(raw_file):
     """
     Filters insurance business data from dashboard data.
@@ -229,6 +323,7 @@ def filter_insurance_business(raw_file):
         str: Path to filtered file, or None on error
     """
     load_dotenv()
+    configure_logging()
     target_date_str = os.getenv("SCRAPE_START_DATE")
     target_date = None
     
@@ -246,8 +341,7 @@ def filter_insurance_business(raw_file):
         return None
     
     try:
-        with open(raw_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(raw_file)
         
         # Check if data is empty or invalid
         if not data:
@@ -261,89 +355,41 @@ def filter_insurance_business(raw_file):
             return None
         
         # Filter for "business": "Insurance" and date from title
-        insurance_data = []
-        auction_paths = []
-        total_insurance = 0
         date_matched = 0
         
-        # The response structure has "response_of_live" array
+        # The response structure has "response_of_live" array (or is itself a list)
         # Each item in response_of_live has "business" field
         if isinstance(data, dict):
-            # Check for response_of_live array
-            response_of_live = data.get("response_of_live") or data.get("responseOfLive") or []
-            
-            if isinstance(response_of_live, list):
-                for item in response_of_live:
-                    if isinstance(item, dict):
-                        # Filter by "business": "Insurance"
-                        business = item.get("business") or item.get("Business")
-                        if business and str(business).lower() == "insurance":
-                            total_insurance += 1
-                            
-                            # Filter by date from title if target_date is set
-                            title = item.get("title") or item.get("auctionTitle") or item.get("name") or ""
-                            if target_date:
-                                title_date = parse_date_from_title(title)
-                                if title_date != target_date:
-                                    # Skip this auction - date doesn't match
-                                    continue
-                                date_matched += 1
-                            
-                            insurance_data.append(item)
-                            
-                            # Create auction path entry
-                            auction_path = {
-                                "auction_id": item.get("auctionId") or item.get("auction_id") or item.get("id"),
-                                "title": title,
-                                "slug": item.get("slug") or item.get("auctionSlug") or item.get("url") or "",
-                                "vehicle_count": item.get("vehicleCount") or item.get("totalVehicles") or item.get("count") or item.get("vehicle_count") or 0,
-                                "vehicles": [],
-                                "gj_vehicle_count": 0
-                            }
-                            
-                            # Extract slug from title if not present
-                            if not auction_path["slug"] and auction_path["title"]:
-                                # Convert title to slug format (e.g., "Gujarat PSU and Surveyor Vehicle 05Dec25" -> "Gujarat-PSU-and-Surveyor-Vehicle-05Dec25")
-                                slug = auction_path["title"].replace(" ", "-").replace("/", "-")
-                                auction_path["slug"] = slug
-                            
-                            if auction_path["auction_id"]:
-                                auction_paths.append(auction_path)
-            
-            # Also check if data itself is a list
-            elif isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict):
-                        business = item.get("business") or item.get("Business")
-                        if business and str(business).lower() == "insurance":
-                            total_insurance += 1
-                            
-                            # Filter by date from title if target_date is set
-                            title = item.get("title") or item.get("auctionTitle") or item.get("name") or ""
-                            if target_date:
-                                title_date = parse_date_from_title(title)
-                                if title_date != target_date:
-                                    # Skip this auction - date doesn't match
-                                    continue
-                                date_matched += 1
-                            
-                            insurance_data.append(item)
-                            
-                            auction_path = {
-                                "auction_id": item.get("auctionId") or item.get("auction_id") or item.get("id"),
-                                "title": title,
-                                "slug": item.get("slug") or item.get("auctionSlug") or item.get("url") or "",
-                                "vehicle_count": item.get("vehicleCount") or item.get("totalVehicles") or item.get("count") or item.get("vehicle_count") or 0,
-                                "vehicles": [],
-                                "gj_vehicle_count": 0
-                            }
-                            
-                            if not auction_path["slug"] and auction_path["title"]:
-                                slug = auction_path["title"].replace(" ", "-").replace("/", "-")
-                                auction_path["slug"] = slug
-                            
-                            if auction_path["auction_id"]:
-                                auction_paths.append(auction_path)
+            items = data.get("response_of_live") or data.get("responseOfLive") or []
+        else:
+            items = data
+        if not isinstance(items, list):
+            items = []
+        
+        # Pass 1: keep only "business": "Insurance" rows
+        insurance_items = [
+            item for item in items
+            if isinstance(item, dict)
+            and str(first_value(item, "business", "Business", default="")).lower() == "insurance"
+        ]
+        total_insurance = len(insurance_items)
+        
+        # Pass 2: filter by date from title if target_date is set
+        titled_items = [(item, first_value(item, "title", "auctionTitle", "name", default="")) for item in insurance_items]
+        if target_date:
+            date_hints = title_date_hints(target_date)
+            titled_items = [
+                (item, title) for item, title in titled_items
+                if any(hint in title.lower() for hint in date_hints)
+                and parse_date_from_title(title) == target_date
+            ]
+            date_matched = len(titled_items)
+        
+        insurance_data = [item for item, _ in titled_items]
+        auction_paths = [
+            auction_path for auction_path in (build_auction_path(item, title) for item, title in titled_items)
+            if auction_path["auction_id"]
+        ]
         
         # Log filtering results
         if target_date:
@@ -356,16 +402,16 @@ def filter_insurance_business(raw_file):
             insurance_filename = "downloads/cardekho_insurance_data.json"
             os.makedirs("downloads", exist_ok=True)
             
-            with open(insurance_filename, "w", encoding="utf-8") as f:
-                json.dump(insurance_data, f, indent=4, ensure_ascii=False)
+            write_json(insurance_filename, insurance_data)
+            save_parquet_copy(insurance_data, "downloads/cardekho_insurance_data.parquet")
             
             logging.info(f"✅ Filtered {len(insurance_data)} insurance business entries to {insurance_filename}")
             
             # Create auction_paths.json for vehicle scraping
             if auction_paths:
                 paths_filename = "downloads/cardekho_auction_paths.json"
-                with open(paths_filename, "w", encoding="utf-8") as f:
-                    json.dump(auction_paths, f, indent=4, ensure_ascii=False)
+                write_json(paths_filename, auction_paths)
+                save_parquet_copy(auction_paths, "downloads/cardekho_auction_paths.parquet")
                 
                 logging.info(f"✅ Created auction paths file: {paths_filename} ({len(auction_paths)} auctions)")
             
@@ -9,32 +9,183 @@ Scrapes vehicle details from CarDekho auction pages:
 """
 
 import os
-import json
 import re
 import logging
-import requests
 import time
+import atexit
+import collections
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from dotenv import load_dotenv
 from scraper.cardekho_events_scraper import extract_headers_from_cookie
+from scraper.json_io import read_json, write_json
+from scraper.log_setup import configure_logging
+from scraper.rate_limiter import RateLimiter
+from scraper.session import build_session
 
-# === Logging Setup ===
-os.makedirs("logs", exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-    handlers=[
-        logging.FileHandler("logs/scraper.log", encoding="utf-8"),
-        logging.StreamHandler()
-    ],
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    sync_playwright = None
+    
+    class PlaywrightTimeoutError(Exception):
+        """Placeholder so except clauses still work without Playwright."""
 
 BASE_URL = "https://auctions.cardekho.com"
 
+# Persistent browser state (cookies/localStorage snapshot, Chromium disk caches)
+BROWSER_STATE_DIR = os.path.join("downloads", "cardekho_browser")
+BROWSER_STATE_FILE = os.path.join(BROWSER_STATE_DIR, "storage_state.json")
+
+# Per-auction results, written as each auction finishes so progress survives
+# a crash without rewriting the whole auction paths file every time
+AUCTION_CHECKPOINT_DIR = os.path.join("downloads", "cardekho_auctions")
+
+# Resource types the headless browser never needs to download
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# lxml is several times faster than the pure-Python html.parser on the large
+# post-scroll auction pages
+HTML_PARSER = "lxml"
+
+# Image extraction needs only attribute lookups, so it runs one compiled XPath
+# over the raw lxml tree instead of several BeautifulSoup find_all scans. The
+# XPath already drops nodes with no CDN upload URL in any candidate attribute,
+# so only those reach the Python loop.
+CDN_MARKER = "auctionscdn.cardekho.com/auctionuploads/"
+IMAGE_ATTRS = ("data-src-pop", "data-src", "data-thumb")
+IMAGE_NODES_XPATH = etree.XPath(
+    "//*[contains(@data-src-pop, $cdn) or contains(@data-src, $cdn) or contains(@data-thumb, $cdn)]"
+    " | //img[contains(@src, $cdn) or contains(@data-lazy-src, $cdn)]"
+)
+
+# Auction listing / vehicle detail patterns, compiled once and shared by the
+# per-row extractors (also used directly as bs4 find_all filters)
+VEHICLE_VID_RE = re.compile(r'#/auction/vehicleDetail/([^/]+)/')
+VID_RE = re.compile(r'VID:\s*([A-Z0-9]+)')
+VDP_TITLE_CLASS_RE = re.compile(r'title_vdp|title')
+GJ_REG_RE = re.compile(r'GJ\d+[A-Z]?\d+[A-Z]?')
+WHITESPACE_RE = re.compile(r'\s+')
+YEAR_RE = re.compile(r'(\d{4})')
+RC_PREFIX_RE = re.compile(r'^RC:\s*', re.IGNORECASE)
+REG_SANITIZE_RE = re.compile(r'[^A-Za-z0-9]')  # Registration number -> folder name
+
+# (label, key) pairs written to metadata.txt by scrape_cardekho_vehicles,
+# in order; keys missing from the details dict are left out
+VEHICLE_DETAIL_LABELS = (
+    ("Make/Model", "make_model"),
+    ("Registration Number", "registration"),
+    ("Manufacturing Year", "year"),
+    ("Location", "location"),
+    ("Paper Status", "paper_status"),
+    ("RC Status", "rc_status"),
+    ("Transmission", "transmission"),
+    ("Ownership", "ownership"),
+    ("Fuel Type", "fuel_type"),
+)
+
+# Leading bullets and whitespace on li text: "•" plus every character the
+# regex class \s matches, so str.lstrip replaces re.sub(r'^[•\s]+', '', ...)
+BULLET_STRIP_CHARS = (
+    "•\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003"
+    "\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Vehicle detail hrefs are "#/auction/vehicleDetail/<vid>/<item_id>"
+VEHICLE_DETAIL_MARKER = "#/auction/vehicleDetail/"
+
+# Vehicle rows are <tr id="auction_item_<item_id>">
+AUCTION_ITEM_PREFIX = "auction_item_"
+
+# Descendant text nodes of an lxml element, minus script/style contents
+ELEMENT_TEXT_XPATH = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+# Auction table selectors: attribute prefix/substring tests run inside
+# libxml2 instead of a Python regex per tag
+AUCTION_ROWS_XPATH = etree.XPath("//tr[starts-with(@id, $prefix)]")
+DOWNLOAD_ROWS_XPATH = etree.XPath("//tr[contains(@ng-repeat, 'det in auctionDetailDownload')]")
+VEHICLE_LINKS_XPATH = etree.XPath("//a[contains(@href, '#/auction/vehicleDetail/')]")
+ROW_LINK_XPATH = etree.XPath("(.//a[contains(@href, '#/auction/vehicleDetail/')])[1]")
+ROW_TITLE_DIV_XPATH = etree.XPath("(.//div[contains(@class, 'title')])[1]")
+ROW_TITLED_LI_XPATH = etree.XPath(".//li[@title]")
+
+# Readiness predicates for vehicle detail pages: a gallery trigger (or the
+# gallery itself) has rendered, and the opened gallery has its full-size URLs
+VEHICLE_PAGE_READY_JS = """
+() => !!document.querySelector(
+    'a.viewphoto, [ng-click*="viewPhotos"], .viewphoto, img.vdp_img, [data-src-pop]'
+)
+"""
+GALLERY_READY_JS = "() => document.querySelectorAll('[data-src-pop]').length > 0"
+
+# Gallery triggers in order of preference: the "Click to view all photos"
+# link, then the main vehicle image
+GALLERY_TRIGGER_SELECTORS = (
+    'a.viewphoto, a[ng-click*="viewPhotos"], .viewphoto',
+    'img.vdp_img, img[ng-click*="viewPhotos"]',
+)
+
+# Scrolls an auction page until lazy loading stops adding vehicle rows. After
+# each scroll a MutationObserver waits until the row count has been stable for
+# settleMs. It stops once a scroll adds nothing, after maxEmptyRounds scrolls
+# that still show no rows, or when the maxMs budget runs out. Resolves to the
+# final row count.
+SCROLL_TO_END_JS = """
+async ({selector, settleMs, maxEmptyRounds, maxMs}) => {
+    const count = () => document.querySelectorAll(selector).length;
+    const deadline = Date.now() + maxMs;
+    const settle = () => new Promise(resolve => {
+        let seen = count();
+        let timer;
+        const observer = new MutationObserver(() => {
+            const now = count();
+            if (now !== seen) {
+                seen = now;
+                clearTimeout(timer);
+                timer = setTimeout(done, settleMs);
+            }
+        });
+        const hardStop = setTimeout(done, Math.max(0, deadline - Date.now()));
+        function done() {
+            observer.disconnect();
+            clearTimeout(timer);
+            clearTimeout(hardStop);
+            resolve();
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+        timer = setTimeout(done, settleMs);
+    });
+
+    let emptyRounds = 0;
+    while (Date.now() < deadline) {
+        const before = count();
+        window.scrollTo(0, document.body.scrollHeight);
+        await settle();
+        const after = count();
+        if (after === 0) {
+            if (++emptyRounds >= maxEmptyRounds) break;
+        } else if (after === before) {
+            break;
+        }
+    }
+    return count();
+}
+"""
+
 
 def get_headers(cookie):
     """Get request headers with authentication."""
+    # Built once per cookie; hand each caller its own dict
+    return dict(_build_headers(cookie))
+
+
+@lru_cache(maxsize=4)
+def _build_headers(cookie):
+    """Build the authenticated header set for a cookie. Returns an immutable tuple of (name, value) pairs."""
     extracted_headers = extract_headers_from_cookie(cookie)
     
     headers = {
@@ -58,7 +209,244 @@ def get_headers(cookie):
     }
     
     headers.update(extracted_headers)
-    return headers
+    return tuple(headers.items())
+
+
+def block_heavy_resources(route):
+    """
+    Playwright route handler that aborts image, media and font requests.
+    Stylesheets still load because the gallery click targets need layout.
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def log_api_response(response):
+    """
+    Log the XHR/fetch calls the auction SPA makes while loading, at debug
+    level. These are the candidate JSON endpoints for reading listings
+    without rendering and parsing the page.
+    """
+    if response.request.resource_type in ("xhr", "fetch"):
+        logging.debug(f"   🔎 API {response.status} {response.request.method} {response.url}")
+
+
+def log_playwright_missing():
+    """Log install instructions when Playwright is unavailable."""
+    logging.error("   ❌ Playwright not installed. Install it with: pip install playwright")
+    logging.error("   💡 Then install browsers: playwright install chromium")
+
+
+@lru_cache(maxsize=4)
+def parse_cookie_to_playwright(cookie):
+    """
+    Convert a raw Cookie header into Playwright cookie dicts. The cookie does
+    not change during a run, so the parsed result is cached.
+    
+    Args:
+        cookie (str): Authentication cookie ("name=value; name2=value2")
+        
+    Returns:
+        tuple: Cookie dicts scoped to auctions.cardekho.com
+    """
+    if not cookie:
+        return ()
+    
+    cookies_list = []
+    for cookie_pair in cookie.split(';'):
+        cookie_pair = cookie_pair.strip()
+        if '=' in cookie_pair:
+            name, value = cookie_pair.split('=', 1)
+            cookies_list.append({
+                'name': name.strip(),
+                'value': value.strip(),
+                'domain': 'auctions.cardekho.com',
+                'path': '/'
+            })
+    return tuple(cookies_list)
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium workers shared by every CarDekho page fetch.
+    
+    Playwright's sync API ties its objects to the thread that created them, so
+    each worker thread owns one browser and one context (cookies and headers set
+    once) and callers hand it work through a queue. Pages are opened and closed
+    per fetch; the browser only goes away on shutdown(), which also saves the
+    context's storage state for the next run. Page loads are paced by a
+    shared token bucket (CARDEKHO_RATE_LIMIT pages/second) instead of fixed
+    sleeps between auctions.
+    """
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self, cookie, size=4, rate=0):
+        self.cookie = cookie
+        self.limiter = RateLimiter(rate)
+        self.tasks = queue.Queue()
+        self.threads = [
+            threading.Thread(target=self._worker, args=(i,), name=f"browser-{i}", daemon=True)
+            for i in range(size)
+        ]
+        for thread in self.threads:
+            thread.start()
+    
+    @classmethod
+    def get(cls, cookie):
+        """Return the shared pool, starting it on first use."""
+        with cls._lock:
+            if cls._instance is None:
+                size = max(1, int(os.getenv("CARDEKHO_BROWSER_CONCURRENCY", 4)))
+                rate = float(os.getenv("CARDEKHO_RATE_LIMIT", 2))
+                cls._instance = cls(cookie, size, rate)
+                atexit.register(cls.shutdown)
+            return cls._instance
+    
+    @classmethod
+    def shutdown(cls):
+        """Close every browser in the shared pool, if one was started."""
+        with cls._lock:
+            pool, cls._instance = cls._instance, None
+        if pool:
+            for _ in pool.threads:
+                pool.tasks.put(None)
+            for thread in pool.threads:
+                thread.join()
+    
+    def run(self, fn, *args):
+        """
+        Run fn(context, *args) on a free browser and wait for its result.
+        Exceptions raised by fn are re-raised in the calling thread.
+        """
+        self.limiter.acquire()
+        future = Future()
+        self.tasks.put((future, fn, args))
+        return future.result()
+    
+    def _launch(self, playwright, index):
+        # Each browser gets its own disk cache (Chromium locks the directory),
+        # so the SPA's scripts and templates are served locally after the
+        # first run
+        os.makedirs(BROWSER_STATE_DIR, exist_ok=True)
+        browser = playwright.chromium.launch(headless=True, args=[
+            f"--disk-cache-dir={os.path.join(BROWSER_STATE_DIR, f'cache-{index}')}",
+            "--disk-cache-size=524288000",
+        ])
+        
+        # Start from the last run's cookies and localStorage when available
+        user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
+        context = None
+        if os.path.exists(BROWSER_STATE_FILE):
+            try:
+                context = browser.new_context(user_agent=user_agent, storage_state=BROWSER_STATE_FILE)
+            except Exception as e:
+                logging.warning(f"   ⚠️  Ignoring unreadable browser state {BROWSER_STATE_FILE}: {e}")
+        if context is None:
+            context = browser.new_context(user_agent=user_agent)
+        
+        # Set cookies
+        cookies_list = parse_cookie_to_playwright(self.cookie)
+        if cookies_list:
+            context.add_cookies(list(cookies_list))
+        
+        context.set_extra_http_headers({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Referer': f'{BASE_URL}/',
+        })
+        
+        # Image URLs are read from the DOM, never from the loaded bytes
+        context.route("**/*", block_heavy_resources)
+        return browser, context
+    
+    def _worker(self, index):
+        playwright = browser = context = None
+        try:
+            if sync_playwright is None:
+                raise ImportError("playwright is not installed")
+            playwright = sync_playwright().start()
+            browser, context = self._launch(playwright, index)
+        except Exception as e:
+            # Fail every task this worker picks up with the startup error
+            # (e.g. Playwright or Chromium not installed)
+            startup_error = e
+        else:
+            startup_error = None
+        
+        try:
+            while True:
+                task = self.tasks.get()
+                if task is None:
+                    break
+                future, fn, args = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if startup_error:
+                    future.set_exception(startup_error)
+                    continue
+                try:
+                    # Relaunch if the browser crashed since the last fetch
+                    if not browser.is_connected():
+                        browser, context = self._launch(playwright, index)
+                    future.set_result(fn(context, *args))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            try:
+                # One worker snapshots the session for the next run
+                if index == 0 and context and browser.is_connected():
+                    context.storage_state(path=BROWSER_STATE_FILE)
+                if browser:
+                    browser.close()
+                if playwright:
+                    playwright.stop()
+            except Exception:
+                pass
+
+
+def render_auction_page(context, url, timeout_ms):
+    """
+    Load an auction detail page in a fresh tab, scroll until every vehicle
+    row has lazy-loaded, and return the rendered HTML.
+    
+    Args:
+        context: Playwright browser context from BrowserPool
+        url (str): Auction detail URL
+        timeout_ms (int): Navigation timeout in milliseconds
+        
+    Returns:
+        str: Rendered HTML
+    """
+    page = context.new_page()
+    page.on("response", log_api_response)
+    try:
+        # Navigate to the page with increased timeout
+        page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
+        
+        # Wait for AngularJS to render the first vehicle rows; the scroll
+        # loop below then waits for the rest to settle
+        try:
+            page.wait_for_selector('a[href*="#/auction/vehicleDetail/"], tr[id*="auction_item_"]', timeout=20000)
+        except PlaywrightTimeoutError:
+            pass  # Continue anyway
+        
+        # Handle infinite scroll - one in-page loop scrolls to the bottom and
+        # waits for the vehicle row count to settle, instead of a Python
+        # round-trip and fixed 2s sleep per scroll
+        page.evaluate(SCROLL_TO_END_JS, {
+            'selector': 'tr[id^="auction_item_"]',
+            'settleMs': 1500,
+            'maxEmptyRounds': 5,
+            'maxMs': 120000,
+        })
+        
+        # Get the rendered HTML after all scrolling
+        return page.content()
+    finally:
+        page.close()
 
 
 def fetch_auction_detail_page(slug, auction_id, cookie, max_retries=3):
@@ -77,116 +465,21 @@ def fetch_auction_detail_page(slug, auction_id, cookie, max_retries=3):
     Returns:
         str: HTML content or None on error
     """
+    if sync_playwright is None:
+        log_playwright_missing()
+        return None
+    
     url = f"{BASE_URL}/#/auctionDetail/{slug}"
     timeout_ms = 90000  # 90 seconds timeout
     
     for attempt in range(1, max_retries + 1):
         try:
-            from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-            
             if attempt > 1:
                 # Exponential backoff: 2^attempt seconds (2s, 4s, 8s)
                 backoff_time = 2 ** attempt
                 time.sleep(backoff_time)
             
-            with sync_playwright() as p:
-                # Launch browser in headless mode
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
-                )
-                
-                # Set cookies
-                if cookie:
-                    cookies_list = []
-                    for cookie_pair in cookie.split(';'):
-                        cookie_pair = cookie_pair.strip()
-                        if '=' in cookie_pair:
-                            name, value = cookie_pair.split('=', 1)
-                            cookies_list.append({
-                                'name': name.strip(),
-                                'value': value.strip(),
-                                'domain': 'auctions.cardekho.com',
-                                'path': '/'
-                            })
-                    if cookies_list:
-                        context.add_cookies(cookies_list)
-                
-                # Create a new page
-                page = context.new_page()
-                
-                # Set extra headers
-                headers = get_headers(cookie)
-                page.set_extra_http_headers({
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Referer': f'{BASE_URL}/',
-                })
-                
-                # Navigate to the page with increased timeout
-                try:
-                    page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
-                    # Wait longer after navigation for content to load
-                    page.wait_for_timeout(3000)  # 3 seconds wait after navigation
-                except PlaywrightTimeoutError as e:
-                    browser.close()
-                    if attempt < max_retries:
-                        logging.warning(f"   ⚠️  Navigation timeout (attempt {attempt}/{max_retries}), will retry...")
-                        continue
-                    else:
-                        logging.error(f"   ❌ Navigation timeout after {max_retries} attempts: {e}")
-                        return None
-                
-                # Wait for vehicle content to load
-                try:
-                    page.wait_for_selector('a[href*="#/auction/vehicleDetail/"], tr[id*="auction_item_"]', timeout=20000)
-                except PlaywrightTimeoutError:
-                    pass  # Continue anyway
-                
-                # Wait longer for AngularJS to finish rendering
-                page.wait_for_timeout(3000)  # Increased from 2000ms to 3000ms
-                
-                # Handle infinite scroll - scroll down to load all vehicles
-                previous_count = 0
-                current_count = len(page.query_selector_all('tr[id^="auction_item_"]'))
-                scroll_attempts = 0
-                max_scroll_attempts = 50
-                
-                # If no vehicles found initially, try scrolling to trigger lazy loading
-                if current_count == 0:
-                    for scroll_retry in range(5):  # Try scrolling 5 times
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        page.wait_for_timeout(3000)  # Longer wait for lazy loading
-                        current_count = len(page.query_selector_all('tr[id^="auction_item_"]'))
-                        if current_count > 0:
-                            break
-                
-                # Scroll to load all vehicles (lazy loading)
-                while scroll_attempts < max_scroll_attempts:
-                    previous_count = current_count
-                    
-                    # Scroll to bottom to trigger loadMore()
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(2000)
-                    
-                    # Check if new vehicles loaded
-                    current_count = len(page.query_selector_all('tr[id^="auction_item_"]'))
-                    
-                    if current_count == previous_count:
-                        break
-                    else:
-                        scroll_attempts += 1
-                
-                # Get the rendered HTML after all scrolling
-                html = page.content()
-                
-                # Close browser properly - wait for any pending tasks
-                try:
-                    page.wait_for_timeout(1000)  # Give time for any pending tasks
-                except:
-                    pass
-                
-                browser.close()
+            html = BrowserPool.get(cookie).run(render_auction_page, url, timeout_ms)
             
             # Check if we got meaningful content
             has_vehicles = 'auction_item_' in html
@@ -203,15 +496,12 @@ def fetch_auction_detail_page(slug, auction_id, cookie, max_retries=3):
                 else:
                     return html  # Return anyway, might have data in different format
             
-        except ImportError:
-            logging.error("   ❌ Playwright not installed. Install it with: pip install playwright")
-            logging.error("   💡 Then install browsers: playwright install chromium")
-            return None
         except PlaywrightTimeoutError as e:
             if attempt < max_retries:
+                logging.warning(f"   ⚠️  Navigation timeout (attempt {attempt}/{max_retries}), will retry...")
                 continue
             else:
-                logging.error(f"   ❌ Timeout after {max_retries} attempts")
+                logging.error(f"   ❌ Navigation timeout after {max_retries} attempts: {e}")
                 return None
         except Exception as e:
             if attempt < max_retries:
@@ -227,6 +517,56 @@ def fetch_auction_detail_page(slug, auction_id, cookie, max_retries=3):
     return None
 
 
+def render_vehicle_page(context, url, timeout_ms):
+    """
+    Load a vehicle detail page in a fresh tab, try to open its photo gallery,
+    and return the rendered HTML.
+    
+    Args:
+        context: Playwright browser context from BrowserPool
+        url (str): Vehicle detail URL
+        timeout_ms (int): Navigation timeout in milliseconds
+        
+    Returns:
+        tuple: (HTML content, whether the gallery was opened)
+    """
+    page = context.new_page()
+    try:
+        # Navigate to the page
+        page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
+        
+        # Wait until AngularJS has rendered a gallery trigger (or the gallery
+        # itself) rather than sleeping a fixed amount
+        try:
+            page.wait_for_function(VEHICLE_PAGE_READY_JS, timeout=15000)
+        except PlaywrightTimeoutError:
+            pass  # Continue anyway
+        
+        # Try to click on "viewPhotos" link or main image to open gallery.
+        # Locators are only counted and clicked in the page, so no element
+        # handles are created
+        gallery_opened = False
+        try:
+            for trigger_selector in GALLERY_TRIGGER_SELECTORS:
+                trigger = page.locator(trigger_selector).first
+                if trigger.count():
+                    trigger.click()
+                    # Wait for gallery to appear
+                    try:
+                        page.wait_for_function(GALLERY_READY_JS, timeout=5000)
+                    except PlaywrightTimeoutError:
+                        pass
+                    gallery_opened = True
+                    break
+        except Exception as e:
+            pass  # Gallery click failed, continue with HTML extraction
+        
+        # Get the rendered HTML (after gallery is opened if possible)
+        return page.content(), gallery_opened
+    finally:
+        page.close()
+
+
 def fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3, auction_idx=None, total_auctions=None, vehicle_idx=None, total_vehicles=None, reg=None):
     """
     Fetch individual vehicle detail page HTML using Playwright.
@@ -242,6 +582,10 @@ def fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3,
     Returns:
         tuple: (HTML content, list of image URLs) or (None, []) on error
     """
+    if sync_playwright is None:
+        log_playwright_missing()
+        return None, []
+    
     # Ensure proper URL construction (vehicle_link might start with # or /)
     # For SPA routes with #, we need BASE_URL/#/path
     if vehicle_link.startswith('#'):
@@ -256,128 +600,41 @@ def fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3,
     
     for attempt in range(1, max_retries + 1):
         try:
-            from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-            
             if attempt > 1:
                 # Exponential backoff
                 backoff_time = 2 ** attempt
                 time.sleep(backoff_time)
             
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
-                )
-                
-                # Set cookies
-                if cookie:
-                    cookies_list = []
-                    for cookie_pair in cookie.split(';'):
-                        cookie_pair = cookie_pair.strip()
-                        if '=' in cookie_pair:
-                            name, value = cookie_pair.split('=', 1)
-                            cookies_list.append({
-                                'name': name.strip(),
-                                'value': value.strip(),
-                                'domain': 'auctions.cardekho.com',
-                                'path': '/'
-                            })
-                    if cookies_list:
-                        context.add_cookies(cookies_list)
-                
-                page = context.new_page()
-                
-                # Set extra headers
-                headers = get_headers(cookie)
-                page.set_extra_http_headers({
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Referer': f'{BASE_URL}/',
-                })
-                
-                # Navigate to the page
-                try:
-                    page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
-                    page.wait_for_timeout(3000)  # Wait for content to load
-                except PlaywrightTimeoutError as e:
-                    browser.close()
-                    if attempt < max_retries:
-                        logging.warning(f"   ⚠️  Navigation timeout (attempt {attempt}/{max_retries}) for vehicle {vid}, will retry...")
-                        continue
-                    else:
-                        logging.error(f"   ❌ Navigation timeout after {max_retries} attempts for vehicle {vid}: {e}")
-                        return None, []
-                
-                # Wait for page content to load
-                try:
-                    page.wait_for_selector('img, .viewphoto, [ng-click*="viewPhotos"]', timeout=15000)
-                except PlaywrightTimeoutError:
-                    pass  # Continue anyway
-                
-                # Wait a bit for page to fully render
-                page.wait_for_timeout(2000)
-                
-                # Try to click on "viewPhotos" link or main image to open gallery
-                gallery_opened = False
-                try:
-                    # Look for "Click to view all photos" link
-                    view_photos_link = page.query_selector('a.viewphoto, a[ng-click*="viewPhotos"], .viewphoto')
-                    if view_photos_link:
-                        view_photos_link.click()
-                        # Wait for gallery to appear
-                        try:
-                            page.wait_for_selector('#imageGallery, .gallery, [data-src-pop]', timeout=5000)
-                        except:
-                            pass
-                        page.wait_for_timeout(2000)  # Additional wait for images to load
-                        gallery_opened = True
-                    else:
-                        # Try clicking on the main vehicle image
-                        main_image = page.query_selector('img.vdp_img, img[ng-click*="viewPhotos"]')
-                        if main_image:
-                            main_image.click()
-                            # Wait for gallery to appear
-                            try:
-                                page.wait_for_selector('#imageGallery, .gallery, [data-src-pop]', timeout=5000)
-                            except:
-                                pass
-                            page.wait_for_timeout(2000)  # Additional wait for images to load
-                            gallery_opened = True
-                except Exception as e:
-                    pass  # Gallery click failed, continue with HTML extraction
-                
-                # Get the rendered HTML (after gallery is opened if possible)
-                html = page.content()
-                
-                # Extract image URLs from HTML using multiple methods
-                image_urls = extract_image_urls_from_html(html)
-                
-                # Log gallery click result with context
-                context = ""
-                if auction_idx and total_auctions and vehicle_idx and total_vehicles:
-                    context = f" [Auction: {auction_idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{total_vehicles}]"
-                
-                if gallery_opened:
-                    if len(image_urls) > 0:
-                        retry_text = f" (retry {attempt})" if attempt > 1 else ""
-                        logging.info(f"      {context} 🖼️ Gallery opened{retry_text}: Found {len(image_urls)} images")
-                    else:
-                        retry_text = f" (retry {attempt}/{max_retries})" if attempt < max_retries else f" (after {max_retries} attempts)"
-                        logging.warning(f"      {context} 🖼️ Gallery opened{retry_text}: No images found")
+            html, gallery_opened = BrowserPool.get(cookie).run(render_vehicle_page, url, timeout_ms)
+            
+            # Extract image URLs from HTML using multiple methods
+            image_urls = extract_image_urls_from_html(html)
+            
+            # Log gallery click result with context
+            context = ""
+            if auction_idx and total_auctions and vehicle_idx and total_vehicles:
+                context = f" [Auction: {auction_idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{total_vehicles}]"
+            
+            if gallery_opened:
+                if len(image_urls) > 0:
+                    retry_text = f" (retry {attempt})" if attempt > 1 else ""
+                    logging.debug("      %s 🖼️ Gallery opened%s: Found %d images", context, retry_text, len(image_urls))
                 else:
-                    if len(image_urls) > 0:
-                        retry_text = f" (retry {attempt})" if attempt > 1 else ""
-                        logging.info(f"      {context} 🖼️ Gallery not opened{retry_text}: Found {len(image_urls)} images from HTML")
-                    else:
-                        retry_text = f" (retry {attempt}/{max_retries})" if attempt < max_retries else f" (after {max_retries} attempts)"
-                        logging.warning(f"      {context} 🖼️ Gallery not opened{retry_text}: No images found")
-                
-                browser.close()
-                
-                return html, image_urls
+                    retry_text = f" (retry {attempt}/{max_retries})" if attempt < max_retries else f" (after {max_retries} attempts)"
+                    logging.warning(f"      {context} 🖼️ Gallery opened{retry_text}: No images found")
+            else:
+                if len(image_urls) > 0:
+                    retry_text = f" (retry {attempt})" if attempt > 1 else ""
+                    logging.debug("      %s 🖼️ Gallery not opened%s: Found %d images from HTML", context, retry_text, len(image_urls))
+                else:
+                    retry_text = f" (retry {attempt}/{max_retries})" if attempt < max_retries else f" (after {max_retries} attempts)"
+                    logging.warning(f"      {context} 🖼️ Gallery not opened{retry_text}: No images found")
+            
+            return html, image_urls
                 
         except PlaywrightTimeoutError as e:
             if attempt < max_retries:
+                logging.warning(f"   ⚠️  Navigation timeout (attempt {attempt}/{max_retries}) for vehicle {vid}, will retry...")
                 continue
             else:
                 context = ""
@@ -422,47 +679,20 @@ def extract_image_urls_from_html(html_content):
         return image_urls
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Method 1: Extract from data-src-pop attributes (gallery full-size images)
-        gallery_items = soup.find_all(attrs={'data-src-pop': True})
-        for item in gallery_items:
-            src = item.get('data-src-pop')
-            if src and 'auctionscdn.cardekho.com/auctionuploads/' in src:
-                clean_url = src.split('?')[0]
-                if clean_url not in seen_urls:
-                    image_urls.append(clean_url)
-                    seen_urls.add(clean_url)
-        
-        # Method 2: Extract from data-src attributes
-        data_src_items = soup.find_all(attrs={'data-src': True})
-        for item in data_src_items:
-            src = item.get('data-src')
-            if src and 'auctionscdn.cardekho.com/auctionuploads/' in src:
-                clean_url = src.split('?')[0]
-                if clean_url not in seen_urls:
-                    image_urls.append(clean_url)
-                    seen_urls.add(clean_url)
-        
-        # Method 3: Extract from data-thumb attributes
-        data_thumb_items = soup.find_all(attrs={'data-thumb': True})
-        for item in data_thumb_items:
-            src = item.get('data-thumb')
-            if src and 'auctionscdn.cardekho.com/auctionuploads/' in src:
-                clean_url = src.split('?')[0]
-                if clean_url not in seen_urls:
-                    image_urls.append(clean_url)
-                    seen_urls.add(clean_url)
-        
-        # Method 4: Extract from img src attributes (fallback)
-        img_tags = soup.find_all('img')
-        for img in img_tags:
-            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-            if src and 'auctionscdn.cardekho.com/auctionuploads/' in src:
-                clean_url = src.split('?')[0]
-                if clean_url not in seen_urls:
-                    image_urls.append(clean_url)
-                    seen_urls.add(clean_url)
+        tree = lxml_html.fromstring(html_content)
+        
+        # Gallery full-size (data-src-pop), lazy (data-src) and thumbnail
+        # (data-thumb) attributes on any element, plus img src as fallback
+        for node in IMAGE_NODES_XPATH(tree, cdn=CDN_MARKER):
+            candidates = [node.get(attr) for attr in IMAGE_ATTRS]
+            if node.tag == 'img':
+                candidates.append(node.get('src') or node.get('data-src') or node.get('data-lazy-src'))
+            
+            for src in candidates:
+                if src and CDN_MARKER in src:
+                    seen_urls.add(src.partition('?')[0])
+        
+        image_urls = list(seen_urls)
         
         # Sort to ensure consistent order
         image_urls.sort()
@@ -473,6 +703,27 @@ def extract_image_urls_from_html(html_content):
     return image_urls
 
 
+def parse_vehicle_detail_href(href):
+    """
+    Split a vehicle detail href into its VID and item ID.
+    
+    Args:
+        href (str): Link such as "#/auction/vehicleDetail/H5G9T7GA/6629538"
+        
+    Returns:
+        tuple: (vid, item_id), or None if the href is not a vehicle detail link
+    """
+    _, sep, rest = href.partition(VEHICLE_DETAIL_MARKER)
+    if not sep:
+        return None
+    # Drop any query string or fragment after the IDs (e.g. "?ref=x", "#top")
+    rest = rest.partition('?')[0].partition('#')[0]
+    parts = rest.split('/', 2)
+    if len(parts) >= 2 and parts[0] and parts[1].isdigit():
+        return parts[0], parts[1]
+    return None
+
+
 def extract_vehicle_links_from_auction_page(html_content):
     """
     Extract vehicle links (VID and item_id) from auction detail page HTML.
@@ -484,68 +735,64 @@ def extract_vehicle_links_from_auction_page(html_content):
         list: List of dicts with 'vid' and 'item_id' keys
     """
     vehicles = []
+    seen_item_ids = set()
     
     if not html_content:
         return vehicles
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        tree = lxml_html.fromstring(html_content)
         
         # Method 1: Look for tr elements with id="auction_item_XXXXX"
         # Pattern: <tr id="auction_item_6629539">
-        auction_items = soup.find_all('tr', id=re.compile(r'auction_item_\d+'))
-        
-        for item in auction_items:
-            item_id_match = re.search(r'auction_item_(\d+)', item.get('id', ''))
-            if not item_id_match:
+        for element in AUCTION_ROWS_XPATH(tree, prefix=AUCTION_ITEM_PREFIX):
+            item_id = element.get('id', '')[len(AUCTION_ITEM_PREFIX):]
+            if not item_id.isdigit():
                 continue
-            
-            item_id = item_id_match.group(1)
             vid = None
             
             # Find VID in this row - look for div with class containing "title"
-            vid_div = item.find('div', class_=re.compile(r'title'))
-            if vid_div:
-                vid_text = vid_div.get_text()
-                vid_match = re.search(r'VID:\s*([A-Z0-9]+)', vid_text)
+            vid_div = next(iter(ROW_TITLE_DIV_XPATH(element)), None)
+            if vid_div is not None:
+                vid_match = VID_RE.search(''.join(vid_div.itertext()))
                 if vid_match:
                     vid = vid_match.group(1)
             
             # Alternative: Extract from vehicle detail link
             if not vid:
-                vehicle_link = item.find('a', href=re.compile(r'#/auction/vehicleDetail/'))
-                if vehicle_link:
-                    href = vehicle_link.get('href', '')
-                    match = re.search(r'#/auction/vehicleDetail/([^/]+)/', href)
+                vehicle_link = next(iter(ROW_LINK_XPATH(element)), None)
+                if vehicle_link is not None:
+                    match = VEHICLE_VID_RE.search(vehicle_link.get('href', ''))
                     if match:
                         vid = match.group(1)
             
             if vid and item_id:
                 # Check if we already have this vehicle
-                if not any(v['item_id'] == item_id for v in vehicles):
+                if item_id not in seen_item_ids:
+                    seen_item_ids.add(item_id)
                     vehicles.append({
                         'vid': vid,
                         'item_id': item_id
                     })
-                    logging.debug(f"Found vehicle: VID={vid}, item_id={item_id}")
+                    if debug_enabled:
+                        logging.debug(f"Found vehicle: VID={vid}, item_id={item_id}")
         
-        # Method 2: Find all vehicle detail links (fallback)
+        # Method 2: Use all vehicle detail links (fallback)
         if not vehicles:
-            vehicle_links = soup.find_all('a', href=re.compile(r'#/auction/vehicleDetail/'))
-            
-            for link in vehicle_links:
-                href = link.get('href', '')
-                match = re.search(r'#/auction/vehicleDetail/([^/]+)/(\d+)', href)
-                if match:
-                    vid = match.group(1)
-                    item_id = match.group(2)
+            for link in VEHICLE_LINKS_XPATH(tree):
+                parsed = parse_vehicle_detail_href(link.get('href', ''))
+                if parsed:
+                    vid, item_id = parsed
                     
-                    if not any(v['item_id'] == item_id for v in vehicles):
+                    if item_id not in seen_item_ids:
+                        seen_item_ids.add(item_id)
                         vehicles.append({
                             'vid': vid,
                             'item_id': item_id
                         })
-                        logging.debug(f"Found vehicle from link: VID={vid}, item_id={item_id}")
+                        if debug_enabled:
+                            logging.debug(f"Found vehicle from link: VID={vid}, item_id={item_id}")
         
         logging.info(f"Extracted {len(vehicles)} vehicles from auction page")
         return vehicles
@@ -557,6 +804,23 @@ def extract_vehicle_links_from_auction_page(html_content):
         return vehicles
 
 
+def index_li_by_title(element):
+    """
+    Map each <li title="..."> under element to its first matching tag, so the
+    field lookups below cost one tree walk instead of one walk per field.
+    
+    Args:
+        element: BeautifulSoup tag or document to search
+        
+    Returns:
+        dict: title attribute -> first li tag with that title
+    """
+    li_by_title = {}
+    for li in element.find_all('li', title=True):
+        li_by_title.setdefault(li['title'], li)
+    return li_by_title
+
+
 def extract_vehicle_details_from_listing(tr_element):
     """
     Extract vehicle details directly from auction listing page table row.
@@ -570,6 +834,7 @@ def extract_vehicle_details_from_listing(tr_element):
     """
     try:
         details = {}
+        li_by_title = index_li_by_title(tr_element)
         
         # Extract Make/Model from h2 title
         # Pattern: <h2><a href="#/auction/vehicleDetail/PRERKE4Z/6629539" title="Mahindra Bolero B6 (O) BS-VI">
@@ -581,19 +846,18 @@ def extract_vehicle_details_from_listing(tr_element):
         
         # Extract Registration Number
         # Pattern: <li title="Registration Number" class="ng-binding">GJ34H5655</li>
-        reg_li = tr_element.find('li', title="Registration Number")
+        reg_li = li_by_title.get("Registration Number")
         if reg_li:
             details['registration'] = reg_li.get_text().strip()
         
         # Extract Manufacturing Year
         # Pattern: <li title="Mfg Year" class="ng-binding"><span class="bullet"></span> 2022</li>
-        year_li = tr_element.find('li', title="Mfg Year")
+        year_li = li_by_title.get("Mfg Year")
         if year_li:
             year_text = year_li.get_text().strip()
             # Remove month names, newlines, and extract only year (4 digits)
-            year_text = re.sub(r'\s+', ' ', year_text)  # Normalize whitespace
-            year_text = re.sub(r'\n+', ' ', year_text)  # Remove newlines
-            year_match = re.search(r'(\d{4})', year_text)
+            year_text = WHITESPACE_RE.sub(' ', year_text)  # Normalize whitespace
+            year_match = YEAR_RE.search(year_text)
             if year_match:
                 details['year'] = year_match.group(1)
             else:
@@ -601,49 +865,49 @@ def extract_vehicle_details_from_listing(tr_element):
         
         # Extract Location
         # Pattern: <li title="Location" class="ng-binding"><span class="bullet"></span>Vadodara</li>
-        location_li = tr_element.find('li', title="Location")
+        location_li = li_by_title.get("Location")
         if location_li:
             location_text = location_li.get_text().strip()
-            location_text = re.sub(r'^[•\s]+', '', location_text)
+            location_text = location_text.lstrip(BULLET_STRIP_CHARS)
             details['location'] = location_text
         
         # Extract Paper Status (Scrap/Without Paper)
         # Pattern: <li title="Scrap/Without Paper" class="with_rc ng-scope"><span class="bullet"></span>Without Paper</li>
-        paper_li = tr_element.find('li', title="Scrap/Without Paper")
+        paper_li = li_by_title.get("Scrap/Without Paper")
         if paper_li:
             paper_text = paper_li.get_text().strip()
-            paper_text = re.sub(r'^[•\s]+', '', paper_text)
+            paper_text = paper_text.lstrip(BULLET_STRIP_CHARS)
             details['paper_status'] = paper_text
         
         # Extract RC Status
         # Pattern: <li title="RC Available" class="ng-binding">RC: Without Papers</li>
-        rc_li = tr_element.find('li', title="RC Available")
+        rc_li = li_by_title.get("RC Available")
         if rc_li:
             rc_text = rc_li.get_text().strip()
             details['rc_status'] = rc_text.replace('RC:', '').strip()
         
         # Extract Transmission
         # Pattern: <li title="Transmission" class="ng-binding"><span class="bullet"></span>Manual</li>
-        trans_li = tr_element.find('li', title="Transmission")
+        trans_li = li_by_title.get("Transmission")
         if trans_li:
             trans_text = trans_li.get_text().strip()
-            trans_text = re.sub(r'^[•\s]+', '', trans_text)
+            trans_text = trans_text.lstrip(BULLET_STRIP_CHARS)
             details['transmission'] = trans_text
         
         # Extract Ownership
         # Pattern: <li title="Ownership" class="listsect ng-binding"><span class="bullet"></span>1st Owner</li>
-        owner_li = tr_element.find('li', title="Ownership")
+        owner_li = li_by_title.get("Ownership")
         if owner_li:
             owner_text = owner_li.get_text().strip()
-            owner_text = re.sub(r'^[•\s]+', '', owner_text)
+            owner_text = owner_text.lstrip(BULLET_STRIP_CHARS)
             details['ownership'] = owner_text
         
         # Extract Fuel Type
         # Pattern: <li title="Fuel Type" class="ng-binding"><span class="bullet"></span>Diesel</li>
-        fuel_li = tr_element.find('li', title="Fuel Type")
+        fuel_li = li_by_title.get("Fuel Type")
         if fuel_li:
             fuel_text = fuel_li.get_text().strip()
-            fuel_text = re.sub(r'^[•\s]+', '', fuel_text)
+            fuel_text = fuel_text.lstrip(BULLET_STRIP_CHARS)
             details['fuel_type'] = fuel_text
         
         return details if details.get('registration') else None
@@ -667,11 +931,12 @@ def extract_vehicle_details(html_content):
         return None
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         details = {}
+        li_by_title = index_li_by_title(soup)
         
         # Extract Make/Model from h2 title
-        title_h2 = soup.find('h2', class_=re.compile(r'title_vdp|title'))
+        title_h2 = soup.find('h2', class_=VDP_TITLE_CLASS_RE)
         if title_h2:
             title_link = title_h2.find('a')
             if title_link:
@@ -680,66 +945,65 @@ def extract_vehicle_details(html_content):
                 details['make_model'] = title_h2.get_text().strip()
         
         # Extract Registration Number
-        reg_li = soup.find('li', title="Registration Number")
+        reg_li = li_by_title.get("Registration Number")
         if reg_li:
             details['registration'] = reg_li.get_text().strip()
         else:
-            reg_div = soup.find('div', class_='specdesc', string=re.compile(r'GJ\d+[A-Z]?\d+[A-Z]?'))
+            reg_div = soup.find('div', class_='specdesc', string=GJ_REG_RE)
             if reg_div:
                 details['registration'] = reg_div.get_text().strip()
         
         # Extract Manufacturing Year
-        year_li = soup.find('li', title="Mfg Year")
+        year_li = li_by_title.get("Mfg Year")
         if year_li:
             year_text = year_li.get_text().strip()
             # Remove month names, newlines, and extract only year (4 digits)
-            year_text = re.sub(r'\s+', ' ', year_text)  # Normalize whitespace
-            year_text = re.sub(r'\n+', ' ', year_text)  # Remove newlines
-            year_match = re.search(r'(\d{4})', year_text)
+            year_text = WHITESPACE_RE.sub(' ', year_text)  # Normalize whitespace
+            year_match = YEAR_RE.search(year_text)
             if year_match:
                 details['year'] = year_match.group(1)
             else:
                 details['year'] = year_text.strip()
         
         # Extract Location
-        location_li = soup.find('li', title="Location")
+        location_li = li_by_title.get("Location")
         if location_li:
             location_text = location_li.get_text().strip()
-            location_text = re.sub(r'^[•\s]+', '', location_text)
+            location_text = location_text.lstrip(BULLET_STRIP_CHARS)
             details['location'] = location_text
         
         # Extract Paper Status
-        paper_li = soup.find('li', title="Scrap/Without Paper")
+        paper_li = li_by_title.get("Scrap/Without Paper")
         if paper_li:
             paper_text = paper_li.get_text().strip()
-            paper_text = re.sub(r'^[•\s]+', '', paper_text)
+            paper_text = paper_text.lstrip(BULLET_STRIP_CHARS)
             details['paper_status'] = paper_text
         
         # Extract RC Status
-        rc_li = soup.find('li', title="RC Available")
+        rc_li = li_by_title.get("RC Available")
         if rc_li:
             rc_text = rc_li.get_text().strip()
             details['rc_status'] = rc_text.replace('RC:', '').strip()
         
         # Extract Transmission
-        trans_li = soup.find('li', title="Transmission")
+        trans_li = li_by_title.get("Transmission")
         if trans_li:
             trans_text = trans_li.get_text().strip()
-            trans_text = re.sub(r'^[•\s]+', '', trans_text)
+            trans_text = trans_text.lstrip(BULLET_STRIP_CHARS)
             details['transmission'] = trans_text
         
         # Extract Ownership
-        owner_li = soup.find('li', title="Ownership")
+        owner_li = li_by_title.get("Ownership")
         if owner_li:
             owner_text = owner_li.get_text().strip()
-            owner_text = re.sub(r'^[•\s]+', '', owner_text)
+            owner_text = owner_text.lstrip(BULLET_STRIP_CHARS)
             details['ownership'] = owner_text
         
         # Extract Fuel Type
-        fuel_li = soup.find('li', title="Fuel Type")
+        fuel_li = li_by_title.get("Fuel Type")
         if fuel_li:
             fuel_text = fuel_li.get_text().strip()
-            fuel_text = re.sub(r'^[•\s]+', '', fuel_text)
+            fuel_text = fuel_text.lstrip(BULLET_STRIP_CHARS)
             details['fuel_type'] = fuel_text
         
         return details if details.get('registration') else None
@@ -749,6 +1013,37 @@ def extract_vehicle_details(html_content):
         return None
 
 
+def element_text(element, strip=False):
+    """
+    Text of an lxml element, joined the way BeautifulSoup's get_text() joins
+    it (comments and script/style contents excluded).
+    
+    Args:
+        element: lxml element
+        strip (bool): Strip each text node before joining, like get_text(strip=True)
+        
+    Returns:
+        str: Element text
+    """
+    texts = ELEMENT_TEXT_XPATH(element)
+    if strip:
+        return ''.join(text.strip() for text in texts)
+    return ''.join(texts)
+
+
+def li_text(li):
+    """
+    Stripped text of a listing <li> with its leading bullet removed.
+    
+    Args:
+        li: lxml <li> element
+        
+    Returns:
+        str: Cleaned field value
+    """
+    return element_text(li, strip=True).lstrip(BULLET_STRIP_CHARS)
+
+
 def extract_vehicle_links_from_auction_html(html_content):
     """
     Extract vehicle links and details from auction detail page HTML.
@@ -767,134 +1062,140 @@ def extract_vehicle_links_from_auction_html(html_content):
         return vehicles
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Raw lxml tree: only attributes and text are read, so the
+        # BeautifulSoup wrapper per tag is pure overhead here
+        tree = lxml_html.fromstring(html_content)
         
         # Method 1: Find tr elements with id="auction_item_XXXXX" (most reliable)
         # This gives us both the link and the details in one place
-        auction_items = soup.find_all('tr', id=re.compile(r'auction_item_\d+'))
+        auction_items = AUCTION_ROWS_XPATH(tree, prefix=AUCTION_ITEM_PREFIX)
         
-        seen_vehicles = set()
+        seen_vehicles = set()  # (vid, item_id) pairs
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         
         for tr_item in auction_items:
-            item_id_match = re.search(r'auction_item_(\d+)', tr_item.get('id', ''))
-            if not item_id_match:
+            item_id = tr_item.get('id', '')[len(AUCTION_ITEM_PREFIX):]
+            if not item_id.isdigit():
                 continue
             
-            item_id = item_id_match.group(1)
             vehicle_data = {'item_id': item_id}
             
             # Extract vehicle detail link
-            vehicle_link_tag = tr_item.find('a', href=re.compile(r'#/auction/vehicleDetail/'))
-            if vehicle_link_tag:
+            vehicle_link_tag = next(iter(ROW_LINK_XPATH(tr_item)), None)
+            if vehicle_link_tag is not None:
                 href = vehicle_link_tag.get('href', '')
-                match = re.search(r'#/auction/vehicleDetail/([^/]+)/(\d+)', href)
-                if match:
-                    vid = match.group(1)
+                parsed = parse_vehicle_detail_href(href)
+                if parsed:
+                    vid = parsed[0]
                     vehicle_data['vid'] = vid
                     vehicle_data['vehicle_link'] = href  # Store the full link
                     
                     # Extract Make/Model from title
-                    title_text = vehicle_link_tag.get_text(strip=True)
+                    title_text = element_text(vehicle_link_tag, strip=True)
                     if title_text:
                         vehicle_data['make_model'] = title_text
             
             # If no VID from link, try to get from title div
             if 'vid' not in vehicle_data:
-                vid_div = tr_item.find('div', class_=re.compile(r'title'))
-                if vid_div:
-                    vid_text = vid_div.get_text()
-                    vid_match = re.search(r'VID:\s*([A-Z0-9]+)', vid_text)
+                vid_div = next(iter(ROW_TITLE_DIV_XPATH(tr_item)), None)
+                if vid_div is not None:
+                    vid_text = element_text(vid_div)
+                    vid_match = VID_RE.search(vid_text)
                     if vid_match:
                         vehicle_data['vid'] = vid_match.group(1)
             
+            # Extract the li-based fields from a single pass over the row
+            li_by_title = {}
+            for li in ROW_TITLED_LI_XPATH(tr_item):
+                li_by_title.setdefault(li.get('title'), li)
+            
             # Extract Registration Number
-            reg_li = tr_item.find('li', title="Registration Number")
-            if reg_li:
-                vehicle_data['registration_number'] = reg_li.get_text(strip=True)
+            reg_li = li_by_title.get("Registration Number")
+            if reg_li is not None:
+                vehicle_data['registration_number'] = element_text(reg_li, strip=True)
             
             # Extract Manufacturing Year
-            year_li = tr_item.find('li', title="Mfg Year")
-            if year_li:
-                year_text = year_li.get_text(strip=True)
+            year_li = li_by_title.get("Mfg Year")
+            if year_li is not None:
                 # Remove bullet, month names, newlines, and extract only year (4 digits)
-                year_text = re.sub(r'^[•\s]+', '', year_text)  # Remove leading bullets/spaces
-                year_text = re.sub(r'\s+', ' ', year_text)  # Normalize whitespace
-                year_text = re.sub(r'\n+', ' ', year_text)  # Remove newlines
+                year_text = li_text(year_li)  # Remove leading bullets/spaces
+                year_text = WHITESPACE_RE.sub(' ', year_text)  # Normalize whitespace
                 # Extract only 4-digit year
-                year_match = re.search(r'(\d{4})', year_text)
+                year_match = YEAR_RE.search(year_text)
                 if year_match:
                     vehicle_data['manufacturing_year'] = year_match.group(1)
                 else:
                     vehicle_data['manufacturing_year'] = year_text.strip()
             
             # Extract Location
-            location_li = tr_item.find('li', title="Location")
-            if location_li:
-                location_text = location_li.get_text(strip=True)
-                location_text = re.sub(r'^[•\s]+', '', location_text)
-                vehicle_data['location'] = location_text
+            location_li = li_by_title.get("Location")
+            if location_li is not None:
+                vehicle_data['location'] = li_text(location_li)
             
             # Extract Paper Status (Scrap/Without Paper)
-            paper_li = tr_item.find('li', title="Scrap/Without Paper")
-            if paper_li:
-                paper_text = paper_li.get_text(strip=True)
-                paper_text = re.sub(r'^[•\s]+', '', paper_text)
-                vehicle_data['paper_status'] = paper_text
+            paper_li = li_by_title.get("Scrap/Without Paper")
+            if paper_li is not None:
+                vehicle_data['paper_status'] = li_text(paper_li)
             
             # Extract RC Status
-            rc_li = tr_item.find('li', title="RC Available")
-            if rc_li:
-                rc_text = rc_li.get_text(strip=True)
+            rc_li = li_by_title.get("RC Available")
+            if rc_li is not None:
+                rc_text = element_text(rc_li, strip=True)
                 # Remove "RC:" prefix if present
-                rc_text = re.sub(r'^RC:\s*', '', rc_text, flags=re.IGNORECASE)
+                rc_text = RC_PREFIX_RE.sub('', rc_text)
                 vehicle_data['rc_status'] = rc_text.strip()
             
             # Extract Transmission
-            trans_li = tr_item.find('li', title="Transmission")
-            if trans_li:
-                trans_text = trans_li.get_text(strip=True)
-                trans_text = re.sub(r'^[•\s]+', '', trans_text)
-                vehicle_data['transmission'] = trans_text
+            trans_li = li_by_title.get("Transmission")
+            if trans_li is not None:
+                vehicle_data['transmission'] = li_text(trans_li)
             
             # Extract Ownership
-            owner_li = tr_item.find('li', title="Ownership")
-            if owner_li:
-                owner_text = owner_li.get_text(strip=True)
-                owner_text = re.sub(r'^[•\s]+', '', owner_text)
-                vehicle_data['ownership'] = owner_text
+            owner_li = li_by_title.get("Ownership")
+            if owner_li is not None:
+                vehicle_data['ownership'] = li_text(owner_li)
             
             # Extract Fuel Type
-            fuel_li = tr_item.find('li', title="Fuel Type")
-            if fuel_li:
-                fuel_text = fuel_li.get_text(strip=True)
-                fuel_text = re.sub(r'^[•\s]+', '', fuel_text)
-                vehicle_data['fuel_type'] = fuel_text
+            fuel_li = li_by_title.get("Fuel Type")
+            if fuel_li is not None:
+                vehicle_data['fuel_type'] = li_text(fuel_li)
             
             # Only add if we have at least VID and item_id
             if vehicle_data.get('vid') and vehicle_data.get('item_id'):
-                vehicle_key = f"{vehicle_data['vid']}_{vehicle_data['item_id']}"
+                vehicle_key = (vehicle_data['vid'], vehicle_data['item_id'])
                 if vehicle_key not in seen_vehicles:
                     seen_vehicles.add(vehicle_key)
                     vehicles.append(vehicle_data)
-                    logging.debug(f"Found vehicle: VID={vehicle_data.get('vid')}, item_id={item_id}, reg={vehicle_data.get('registration_number', 'N/A')}")
+                    if debug_enabled:
+                        logging.debug(f"Found vehicle: VID={vehicle_data.get('vid')}, item_id={item_id}, reg={vehicle_data.get('registration_number', 'N/A')}")
         
         # Extract Yard Name and Yard Location from download table (auctionDetailDownload)
         # The download table structure:
         # Index 0: VID, Index 1: Registration, Index 2-4: empty, Index 5: Make, Index 6: Model,
         # Index 7: Variant, Index 8: Mfg Year, Index 9: Fuel Type, Index 10: Owner Serial,
         # Index 11: Yard Name, Index 12: Yard Address
-        download_table_rows = soup.find_all('tr', {'ng-repeat': re.compile(r'det in auctionDetailDownload')})
+        download_table_rows = DOWNLOAD_ROWS_XPATH(tree)
         
         # Create a mapping of registration number to yard details
         yard_details_map = {}
         for download_row in download_table_rows:
-            tds = download_row.find_all('td', class_='ng-binding')
-            if len(tds) >= 13:  # Need at least 13 columns (0-12)
-                # Extract registration number (index 1)
-                reg_from_table = tds[1].get_text(strip=True) if len(tds) > 1 else ''
-                # Yard Name is at index 11, Yard Address is at index 12
-                yard_name = tds[11].get_text(strip=True) if len(tds) > 11 else ''
-                yard_location = tds[12].get_text(strip=True) if len(tds) > 12 else ''
+            # Walk the ng-binding cells once, stopping at index 12; only
+            # Registration (1), Yard Name (11) and Yard Address (12) are kept
+            cells = {}
+            binding_idx = 0
+            for td in download_row.iter('td'):
+                if 'ng-binding' not in td.get('class', '').split():
+                    continue
+                if binding_idx in (1, 11, 12):
+                    cells[binding_idx] = td
+                if binding_idx == 12:
+                    break
+                binding_idx += 1
+            
+            if 12 in cells:  # Need at least 13 columns (0-12)
+                reg_from_table = element_text(cells[1], strip=True)
+                yard_name = element_text(cells[11], strip=True)
+                yard_location = element_text(cells[12], strip=True)
                 
                 # Use registration number as key (more reliable than VID)
                 if reg_from_table:
@@ -912,16 +1213,15 @@ def extract_vehicle_links_from_auction_html(html_content):
         
         # Method 2: Fallback - Find all vehicle detail links if Method 1 didn't work
         if not vehicles:
-            vehicle_links = soup.find_all('a', href=re.compile(r'#/auction/vehicleDetail/'))
+            vehicle_links = VEHICLE_LINKS_XPATH(tree)
             
             for link in vehicle_links:
                 href = link.get('href', '')
-                match = re.search(r'#/auction/vehicleDetail/([^/]+)/(\d+)', href)
-                if match:
-                    vid = match.group(1)
-                    item_id = match.group(2)
+                parsed = parse_vehicle_detail_href(href)
+                if parsed:
+                    vid, item_id = parsed
                     
-                    vehicle_key = f"{vid}_{item_id}"
+                    vehicle_key = (vid, item_id)
                     if vehicle_key not in seen_vehicles:
                         seen_vehicles.add(vehicle_key)
                         vehicles.append({
@@ -929,7 +1229,8 @@ def extract_vehicle_links_from_auction_html(html_content):
                             'item_id': item_id,
                             'vehicle_link': href
                         })
-                        logging.debug(f"Found vehicle from link: VID={vid}, item_id={item_id}")
+                        if debug_enabled:
+                            logging.debug(f"Found vehicle from link: VID={vid}, item_id={item_id}")
         
         logging.info(f"Extracted {len(vehicles)} vehicle links from auction page")
         return vehicles
@@ -941,13 +1242,218 @@ def extract_vehicle_links_from_auction_html(html_content):
         return vehicles
 
 
+def fetch_vehicle_images(vehicle, cookie, vehicle_idx, total_vehicles, auction_idx, total_auctions, indent="      ", max_attempts=3):
+    """
+    Fetch a vehicle's detail page and store its image URLs on the vehicle
+    under 'vehicleimages', retrying when no images come back.
+    
+    Args:
+        vehicle (dict): Vehicle entry from the auction page (updated in place)
+        cookie (str): Authentication cookie
+        vehicle_idx (int): 1-based position of the vehicle, for logging
+        total_vehicles (int): Number of vehicles in this batch, for logging
+        auction_idx (int): 1-based auction position, for logging
+        total_auctions (int): Total auctions, for logging
+        indent (str): Log line indent
+        max_attempts (int): Page fetches before giving up (default: 3)
+        
+    Returns:
+        list: Image URLs found (empty list on failure)
+    """
+    vid = vehicle.get('vid')
+    item_id = vehicle.get('item_id')
+    vehicle_link = vehicle.get('vehicle_link', '')
+    reg = vehicle.get('registration_number', 'N/A')
+    prefix = f"{indent}[Auction: {auction_idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{total_vehicles}] {reg}"
+    
+    vehicle['vehicleimages'] = []
+    if not vid or not item_id:
+        logging.warning(f"{prefix}: ⚠️ Missing VID or item_id")
+        return []
+    
+    logging.debug("%s (VID: %s)", prefix, vid)
+    
+    for attempt in range(1, max_attempts + 1):
+        try:
+            html, image_urls = fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3, auction_idx=auction_idx, total_auctions=total_auctions, vehicle_idx=vehicle_idx, total_vehicles=total_vehicles, reg=reg)
+            if image_urls:
+                vehicle['vehicleimages'] = image_urls
+                if attempt > 1:
+                    logging.info(f"{prefix}: ✅ Found {len(image_urls)} images (retry {attempt})")
+                break
+            elif attempt < max_attempts:
+                logging.warning(f"{prefix}: ⚠️ No images (retry {attempt}/{max_attempts})")
+                time.sleep(2)
+        except Exception:
+            if attempt < max_attempts:
+                logging.warning(f"{prefix}: ⚠️ Error (retry {attempt}/{max_attempts})")
+                time.sleep(2)
+            else:
+                logging.error(f"{prefix}: ❌ Failed after {max_attempts} attempts")
+    
+    if not vehicle['vehicleimages']:
+        logging.warning(f"{prefix}: ⚠️ No images found")
+    
+    return vehicle['vehicleimages']
+
+
+def fetch_images_for_vehicles(vehicles, cookie, auction_idx, total_auctions, max_workers=4, indent="      "):
+    """
+    Fetch images for several vehicles in parallel. Page loads queue on the
+    shared BrowserPool, whose size caps concurrent requests to the site, so
+    workers need no per-vehicle sleep.
+    
+    Args:
+        vehicles (list): Vehicle entries (each updated in place)
+        cookie (str): Authentication cookie
+        auction_idx (int): 1-based auction position, for logging
+        total_auctions (int): Total auctions, for logging
+        max_workers (int): Concurrent browser fetches (default: 4)
+        indent (str): Log line indent
+        
+    Returns:
+        int: Number of vehicles that ended up with images
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(vehicles)))) as executor:
+        futures = [
+            executor.submit(fetch_vehicle_images, vehicle, cookie, vehicle_idx, len(vehicles), auction_idx, total_auctions, indent)
+            for vehicle_idx, vehicle in enumerate(vehicles, 1)
+        ]
+        for future in futures:
+            future.result()
+    
+    # Per-vehicle successes log at DEBUG; this is the INFO-level summary
+    with_images = sum(1 for vehicle in vehicles if vehicle['vehicleimages'])
+    logging.info(f"{indent}📊 Images: {with_images}/{len(vehicles)} vehicles")
+    return with_images
+
+
+def filter_gj_with_papers(vehicles):
+    """
+    Keep only Gujarat (GJ) vehicles whose RC status is "With Papers".
+    
+    The registration prefix is checked first (most vehicles fail it), so the
+    RC status is only lowercased for GJ vehicles.
+    
+    Args:
+        vehicles (list): Vehicle dicts from extract_vehicle_links_from_auction_html
+        
+    Returns:
+        list: Matching vehicles, in their original order
+    """
+    filtered_vehicles = []
+    for vehicle in vehicles:
+        if not (vehicle.get('registration_number') or '')[:2].upper().startswith('GJ'):
+            continue
+        if 'with papers' not in (vehicle.get('rc_status') or '').lower():
+            continue
+        filtered_vehicles.append(vehicle)
+    return filtered_vehicles
+
+
+def count_vehicle_progress(vehicles):
+    """
+    Count vehicles with scraped details and with extracted images in one pass.
+    
+    Args:
+        vehicles (list): Filtered vehicle dicts
+        
+    Returns:
+        tuple: (vehicles_with_data, vehicles_with_images)
+    """
+    with_data = with_images = 0
+    for vehicle in vehicles:
+        if vehicle.get('registration_number') and vehicle.get('make_model'):
+            with_data += 1
+        if vehicle.get('vehicleimages'):
+            with_images += 1
+    return with_data, with_images
+
+
+def save_auction_checkpoint(auction):
+    """
+    Save one auction's current results to downloads/cardekho_auctions/<auction_id>.json.
+    
+    Compact JSON of a single auction, so the per-auction save cost no longer
+    grows with the number of auctions already processed.
+    
+    Args:
+        auction (dict): Auction with its vehicles, status and summary
+    """
+    os.makedirs(AUCTION_CHECKPOINT_DIR, exist_ok=True)
+    checkpoint_file = os.path.join(AUCTION_CHECKPOINT_DIR, f"{auction.get('auction_id', 'unknown')}.json")
+    write_json(checkpoint_file, auction, indent=False)
+
+
+def save_auction_paths(paths_file, auctions):
+    """
+    Write the full auction list to the auction paths file.
+    
+    Args:
+        paths_file (str): Path of cardekho_auction_paths.json
+        auctions (list): All auctions
+    """
+    write_json(paths_file, auctions)
+
+
+def load_auction_vehicles(slug, auction_id, cookie):
+    """
+    Fetch an auction detail page and extract its vehicle links.
+    
+    Args:
+        slug (str): Auction slug
+        auction_id (str): Auction ID
+        cookie (str): Cookie string
+        
+    Returns:
+        tuple: (auction_html or None, list of vehicle dicts)
+    """
+    auction_html = fetch_auction_detail_page(slug, auction_id, cookie)
+    if not auction_html:
+        return auction_html, []
+    return auction_html, extract_vehicle_links_from_auction_html(auction_html)
+
+
+def iter_auction_pages(auctions, cookie, max_workers=2):
+    """
+    Fetch and parse auction detail pages concurrently, yielding them in input order.
+    
+    At most max_workers pages are rendering, parsing or waiting to be
+    consumed, so the caller's per-auction work overlaps with the next pages.
+    
+    Args:
+        auctions (list): Auction dicts with 'slug' and 'auction_id'
+        cookie (str): Cookie string
+        max_workers (int): Pages fetched ahead of the consumer
+        
+    Yields:
+        tuple: (index, auction, future) for each auction with a slug; the
+        future resolves to load_auction_vehicles()'s (html, vehicles)
+    """
+    pending = collections.deque(
+        (idx, auction) for idx, auction in enumerate(auctions, 1) if auction.get('slug')
+    )
+    in_flight = collections.deque()
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while pending or in_flight:
+            while pending and len(in_flight) < max_workers:
+                idx, auction = pending.popleft()
+                future = executor.submit(load_auction_vehicles, auction['slug'], auction.get('auction_id', 'Unknown'), cookie)
+                in_flight.append((idx, auction, future))
+            yield in_flight.popleft()
+
+
 def update_auction_paths_with_vehicles():
     """
     Step 3a: Extract vehicle links from each auction detail page
     and update the auction_paths.json file with vehicle information.
     """
     load_dotenv()
+    configure_logging()
     cookie = os.getenv("CAR_DEKHO_COOKIE")
+    browser_workers = max(1, int(os.getenv("CARDEKHO_BROWSER_CONCURRENCY", 4)))
+    auction_workers = max(1, int(os.getenv("CARDEKHO_AUCTION_CONCURRENCY", 2)))
     
     if not cookie:
         logging.error("CAR_DEKHO_COOKIE not found in .env file")
@@ -965,8 +1471,7 @@ def update_auction_paths_with_vehicles():
     logging.info("")
     
     # Load auction paths
-    with open(paths_file, "r", encoding="utf-8") as f:
-        auctions = json.load(f)
+    auctions = read_json(paths_file)
     
     total_auctions = len(auctions)
     logging.info(f"   • Processing {total_auctions} auction(s)")
@@ -977,20 +1482,18 @@ def update_auction_paths_with_vehicles():
     failed_auctions = []  # Track failed auctions for manual retry
     timeout_auctions = []  # Track timeout auctions for retry
     
-    # Process each auction and extract vehicle links
-    for idx, auction in enumerate(auctions, 1):
+    # Process each auction; the next pages render and parse on worker threads
+    # while the current auction is filtered and imaged
+    for idx, auction, page_future in iter_auction_pages(auctions, cookie, max_workers=auction_workers):
         slug = auction.get('slug')
         title = auction.get('title', 'Unknown')
         vehicle_count = auction.get('vehicle_count', 0)
         auction_id = auction.get('auction_id', 'Unknown')
         
-        if not slug:
-            continue
-        
         logging.info(f"   [Auction: {idx}/{total_auctions}] {title} (ID: {auction_id})")
         logging.info(f"      Expected: {vehicle_count} vehicles")
         logging.info(f"      [Auction: {idx}/{total_auctions}] 🌐 Loading auction page...")
-        auction_html = fetch_auction_detail_page(slug, auction_id, cookie)
+        auction_html, all_vehicles = page_future.result()
         if not auction_html:
             logging.warning(f"      [Auction: {idx}/{total_auctions}] ❌ Failed to load page")
             auction['vehicles'] = []
@@ -1005,13 +1508,9 @@ def update_auction_paths_with_vehicles():
                 'index': idx,
                 'error': 'Failed to fetch after all retry attempts'
             })
-            with open(paths_file, "w", encoding="utf-8") as f:
-                json.dump(auctions, f, indent=4, ensure_ascii=False)
-            time.sleep(2)
+            save_auction_checkpoint(auction)
             continue
         
-        # Extract vehicle links from HTML
-        all_vehicles = extract_vehicle_links_from_auction_html(auction_html)
         logging.info(f"      [Auction: {idx}/{total_auctions}] ✅ Loaded: {len(all_vehicles)} vehicles")
         
         # Check if this looks like a timeout (expected vehicles but found 0)
@@ -1029,33 +1528,11 @@ def update_auction_paths_with_vehicles():
             auction['summary'] = f"Status: TIMEOUT - Expected: {vehicle_count}, Loaded: 0, Filtered: 0, With Data: 0, With Images: 0"
             auction['vehicles'] = []
             auction['gj_vehicle_count'] = 0
-            with open(paths_file, "w", encoding="utf-8") as f:
-                json.dump(auctions, f, indent=4, ensure_ascii=False)
+            save_auction_checkpoint(auction)
             continue
         
         # Filter: Only Gujarat (GJ) vehicles with "With Papers" RC status
-        filtered_vehicles = []
-        gj_only_count = 0
-        with_papers_count = 0
-        
-        for vehicle in all_vehicles:
-            reg_no = vehicle.get('registration_number', '')
-            rc_status = vehicle.get('rc_status', '')
-            
-            # Check if it's a Gujarat vehicle
-            is_gj = reg_no and reg_no.upper().startswith('GJ')
-            # Check if RC status is "With Papers" (case-insensitive)
-            is_with_papers = rc_status and 'with papers' in rc_status.lower()
-            
-            # Count statistics
-            if is_gj:
-                gj_only_count += 1
-            if is_with_papers:
-                with_papers_count += 1
-            
-            # Both conditions must be met: GJ + With Papers
-            if is_gj and is_with_papers:
-                filtered_vehicles.append(vehicle)
+        filtered_vehicles = filter_gj_with_papers(all_vehicles)
         
         filtered_out = len(all_vehicles) - len(filtered_vehicles)
         total_vehicles_filtered += filtered_out
@@ -1066,65 +1543,15 @@ def update_auction_paths_with_vehicles():
             logging.info(f"      [Auction: {idx}/{total_auctions}] Filtered: {len(filtered_vehicles)} vehicles (GJ + With Papers)")
         
         # Extract images for each filtered vehicle with retry logic
-        vehicles_with_images = 0
-        vehicles_without_images = []
         if len(filtered_vehicles) > 0:
             logging.info(f"      📸 Extracting images ({len(filtered_vehicles)} vehicles)...")
-            for vehicle_idx, vehicle in enumerate(filtered_vehicles, 1):
-                vid = vehicle.get('vid')
-                item_id = vehicle.get('item_id')
-                vehicle_link = vehicle.get('vehicle_link', '')
-                reg = vehicle.get('registration_number', 'N/A')
-                
-                if not vid or not item_id:
-                    vehicle['vehicleimages'] = []
-                    vehicles_without_images.append({'reg': reg, 'reason': 'Missing VID or item_id'})
-                    logging.warning(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ Missing VID or item_id")
-                    continue
-                
-                logging.info(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg} (VID: {vid})")
-                
-                # Fetch vehicle detail page and extract images with retry (3 attempts)
-                image_urls = []
-                max_image_retries = 3
-                for img_retry in range(1, max_image_retries + 1):
-                    try:
-                        html, image_urls = fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3, auction_idx=idx, total_auctions=total_auctions, vehicle_idx=vehicle_idx, total_vehicles=len(filtered_vehicles), reg=reg)
-                        
-                        if image_urls and len(image_urls) > 0:
-                            vehicle['vehicleimages'] = image_urls
-                            filtered_vehicles[vehicle_idx - 1]['vehicleimages'] = image_urls
-                            vehicles_with_images += 1
-                            if img_retry > 1:
-                                logging.info(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ✅ Found {len(image_urls)} images (retry {img_retry})")
-                            break
-                        elif img_retry < max_image_retries:
-                            logging.warning(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ No images (retry {img_retry}/{max_image_retries})")
-                            time.sleep(2)
-                    except Exception as e:
-                        if img_retry < max_image_retries:
-                            logging.warning(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ Error (retry {img_retry}/{max_image_retries})")
-                            time.sleep(2)
-                        else:
-                            vehicle['vehicleimages'] = []
-                            filtered_vehicles[vehicle_idx - 1]['vehicleimages'] = []
-                            vehicles_without_images.append({'reg': reg, 'vid': vid, 'reason': f'Error: {str(e)[:50]}'})
-                            logging.error(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ❌ Failed after {max_image_retries} attempts")
-                
-                if not image_urls:
-                    vehicle['vehicleimages'] = []
-                    filtered_vehicles[vehicle_idx - 1]['vehicleimages'] = []
-                    vehicles_without_images.append({'reg': reg, 'vid': vid, 'reason': 'No images found'})
-                    logging.warning(f"      [Auction: {idx}/{total_auctions}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ No images found")
-                
-                time.sleep(1)
+            fetch_images_for_vehicles(filtered_vehicles, cookie, idx, total_auctions, max_workers=browser_workers)
         
         # Calculate status metrics
         expected_vehicles = vehicle_count
         loaded_vehicles = len(all_vehicles)
         filtered_count = len(filtered_vehicles)
-        vehicles_with_data = sum(1 for v in filtered_vehicles if v.get('registration_number') and v.get('make_model'))
-        vehicles_with_images_count = sum(1 for v in filtered_vehicles if v.get('vehicleimages') and len(v.get('vehicleimages', [])) > 0)
+        vehicles_with_data, vehicles_with_images_count = count_vehicle_progress(filtered_vehicles)
         
         # Determine status
         if auction_html is None:
@@ -1154,13 +1581,11 @@ def update_auction_paths_with_vehicles():
         total_vehicles_found += filtered_count
         
         # Save after each auction (incremental save to ensure data is persisted)
-        with open(paths_file, "w", encoding="utf-8") as f:
-            json.dump(auctions, f, indent=4, ensure_ascii=False)
+        save_auction_checkpoint(auction)
         
         logging.info(f"      [Auction: {idx}/{total_auctions}] 💾 Saved")
-        
-        # Delay between requests
-        time.sleep(2)
+    
+    save_auction_paths(paths_file, auctions)
     
     # Retry timeout auctions (3 attempts)
     if timeout_auctions:
@@ -1210,63 +1635,15 @@ def update_auction_paths_with_vehicles():
                 retry_successful += 1
                 
                 # Filter: Only Gujarat (GJ) vehicles with "With Papers" RC status
-                filtered_vehicles = []
-                for vehicle in all_vehicles:
-                    reg_no = vehicle.get('registration_number', '')
-                    rc_status = vehicle.get('rc_status', '')
-                    is_gj = reg_no and reg_no.upper().startswith('GJ')
-                    is_with_papers = rc_status and 'with papers' in rc_status.lower()
-                    if is_gj and is_with_papers:
-                        filtered_vehicles.append(vehicle)
+                filtered_vehicles = filter_gj_with_papers(all_vehicles)
                 
                 # Extract images for filtered vehicles (3 attempts each)
                 if len(filtered_vehicles) > 0:
                     logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] 📸 Extracting images ({len(filtered_vehicles)} vehicles)...")
-                    for vehicle_idx, vehicle in enumerate(filtered_vehicles, 1):
-                        vid = vehicle.get('vid')
-                        item_id = vehicle.get('item_id')
-                        vehicle_link = vehicle.get('vehicle_link', '')
-                        reg = vehicle.get('registration_number', 'N/A')
-                        
-                        if not vid or not item_id:
-                            vehicle['vehicleimages'] = []
-                            continue
-                        
-                        logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg} (VID: {vid})")
-                        
-                        # Retry logic for images (3 attempts)
-                        image_urls = []
-                        for img_retry in range(1, 4):
-                            try:
-                                html, image_urls = fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3, auction_idx=auction_main_idx, total_auctions=len(auctions), vehicle_idx=vehicle_idx, total_vehicles=len(filtered_vehicles), reg=reg)
-                                if image_urls and len(image_urls) > 0:
-                                    vehicle['vehicleimages'] = image_urls
-                                    filtered_vehicles[vehicle_idx - 1]['vehicleimages'] = image_urls
-                                    if img_retry > 1:
-                                        logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ✅ Found {len(image_urls)} images (retry {img_retry})")
-                                    break
-                                elif img_retry < 3:
-                                    logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ No images (retry {img_retry}/3)")
-                                    time.sleep(2)
-                            except Exception:
-                                if img_retry < 3:
-                                    logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ Error (retry {img_retry}/3)")
-                                    time.sleep(2)
-                                else:
-                                    vehicle['vehicleimages'] = []
-                                    filtered_vehicles[vehicle_idx - 1]['vehicleimages'] = []
-                                    logging.error(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ❌ Failed after 3 attempts")
-                        
-                        if not image_urls:
-                            vehicle['vehicleimages'] = []
-                            filtered_vehicles[vehicle_idx - 1]['vehicleimages'] = []
-                            logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(filtered_vehicles)}] {reg}: ⚠️ No images found")
-                        
-                        time.sleep(1)
+                    fetch_images_for_vehicles(filtered_vehicles, cookie, auction_main_idx, len(auctions), max_workers=browser_workers, indent="         ")
                 
                 # Update status for retry
-                vehicles_with_data_retry = sum(1 for v in filtered_vehicles if v.get('registration_number') and v.get('make_model'))
-                vehicles_with_images_retry = sum(1 for v in filtered_vehicles if v.get('vehicleimages') and len(v.get('vehicleimages', [])) > 0)
+                vehicles_with_data_retry, vehicles_with_images_retry = count_vehicle_progress(filtered_vehicles)
                 expected_vehicles_retry = vehicle_count
                 loaded_vehicles_retry = len(all_vehicles)
                 
@@ -1291,16 +1668,13 @@ def update_auction_paths_with_vehicles():
                 auction['summary'] = summary_retry
                 
                 # Log summary
-                vehicles_with_images_retry = sum(1 for v in filtered_vehicles if v.get('vehicleimages') and len(v.get('vehicleimages', [])) > 0)
                 logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] ✅ Status: {status_retry.upper()} | With Images: {vehicles_with_images_retry}/{len(filtered_vehicles)}")
                 total_vehicles_found += len(filtered_vehicles)
                 
                 # Save progress after each retry
-                with open(paths_file, "w", encoding="utf-8") as f:
-                    json.dump(auctions, f, indent=4, ensure_ascii=False)
-                
-                time.sleep(2)
+                save_auction_checkpoint(auction)
             
+            save_auction_paths(paths_file, auctions)
             logging.info(f"      ✅ Round {retry_round} complete: {retry_successful} auction(s) resolved")
             
             if not timeout_auctions:
@@ -1311,201 +1685,97 @@ def update_auction_paths_with_vehicles():
         
         logging.info("")
     
-    # Smart retry for partial and failed auctions (3 attempts)
+    # Retry partial and failed auctions in one pass. The page is fetched again
+    # only if it never loaded or fewer vehicles were loaded than expected;
+    # otherwise the vehicles parsed in the first pass are kept and only missing
+    # images are re-fetched (fetch_vehicle_images already retries each vehicle 3 times).
     partial_failed_auctions = [auction for auction in auctions if auction.get('status') in ['partial', 'failed']]
     if partial_failed_auctions:
         logging.info("")
-        logging.info(f"RETRYING PARTIAL/FAILED AUCTIONS: {len(partial_failed_auctions)} auction(s) (3 attempts)")
+        logging.info(f"RETRYING PARTIAL/FAILED AUCTIONS: {len(partial_failed_auctions)} auction(s)")
         logging.info("")
         
-        for retry_round in range(1, 4):  # 3 retry rounds
-            logging.info(f"   Retry Round {retry_round}/3")
-            retry_improved = 0
+        retry_improved = 0
+        
+        for auction_idx, auction in enumerate(partial_failed_auctions, 1):
+            slug = auction.get('slug')
+            auction_id = auction.get('auction_id')
+            title = auction.get('title', 'Unknown')
+            vehicle_count = auction.get('vehicle_count', 0)
+            old_status = auction.get('status')
             
-            for auction_idx, auction in enumerate(partial_failed_auctions[:], 1):
-                if auction.get('status') in ['complete', 'no_match']:
-                    partial_failed_auctions.remove(auction)
-                    continue
-                
-                slug = auction.get('slug')
-                auction_id = auction.get('auction_id')
-                title = auction.get('title', 'Unknown')
-                vehicle_count = auction.get('vehicle_count', 0)
-                existing_vehicles = auction.get('vehicles', [])
-                
-                if not slug:
+            if not slug:
+                continue
+            
+            # Find auction index in main list
+            auction_main_idx = next((i for i, a in enumerate(auctions, 1) if a.get('auction_id') == auction_id), auction_idx)
+            
+            logging.info(f"      [Auction: {auction_main_idx}/{len(auctions)}] {title} (Retry)")
+            
+            existing_vehicles = auction.get('vehicles', [])
+            expected = vehicle_count
+            loaded = len(existing_vehicles)
+            
+            if old_status == 'failed' or expected != loaded:
+                # Page never loaded or came up short: fetch and filter it again
+                logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] 🔄 Reloading auction page (Expected: {expected}, Loaded: {loaded})...")
+                auction_html = fetch_auction_detail_page(slug, auction_id, cookie)
+                if not auction_html:
+                    logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] ❌ Failed to reload")
                     continue
                 
-                # Find auction index in main list
-                auction_main_idx = next((i for i, a in enumerate(auctions, 1) if a.get('auction_id') == auction_id), auction_idx)
-                
-                logging.info(f"      [Auction: {auction_main_idx}/{len(auctions)}] {title} (Retry Round {retry_round}/3)")
-                
-                # Identify successful vehicles (have both data and images)
-                successful_vehicles = []
-                failed_vehicle_keys = set()  # Track which vehicles need retry
-                
-                for vehicle in existing_vehicles:
-                    has_data = vehicle.get('registration_number') and vehicle.get('make_model')
-                    has_images = vehicle.get('vehicleimages') and len(vehicle.get('vehicleimages', [])) > 0
-                    if has_data and has_images:
-                        successful_vehicles.append(vehicle)
-                    else:
-                        vid = vehicle.get('vid')
-                        item_id = vehicle.get('item_id')
-                        if vid and item_id:
-                            failed_vehicle_keys.add(f"{vid}_{item_id}")
-                
-                # Only reload if expected != loaded, or if we have failed vehicles to retry
-                expected = vehicle_count
-                loaded = len(existing_vehicles) if existing_vehicles else 0
-                needs_reload = (expected != loaded) or len(failed_vehicle_keys) > 0
-                
-                if needs_reload and expected != loaded:
-                    # Reload auction page
-                    logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] 🔄 Reloading auction page (Expected: {expected}, Loaded: {loaded})...")
-                    auction_html = fetch_auction_detail_page(slug, auction_id, cookie)
-                    if not auction_html:
-                        logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] ❌ Failed to reload")
-                        continue
-                    
-                    all_vehicles = extract_vehicle_links_from_auction_html(auction_html)
-                    
-                    # Filter: Only Gujarat (GJ) vehicles with "With Papers" RC status
-                    filtered_vehicles = []
-                    for vehicle in all_vehicles:
-                        reg_no = vehicle.get('registration_number', '')
-                        rc_status = vehicle.get('rc_status', '')
-                        is_gj = reg_no and reg_no.upper().startswith('GJ')
-                        is_with_papers = rc_status and 'with papers' in rc_status.lower()
-                        if is_gj and is_with_papers:
-                            filtered_vehicles.append(vehicle)
-                    
-                    # Merge: Keep successful vehicles, retry failed ones
-                    merged_vehicles = successful_vehicles.copy()
-                    for vehicle in filtered_vehicles:
-                        vid = vehicle.get('vid')
-                        item_id = vehicle.get('item_id')
-                        vehicle_key = f"{vid}_{item_id}" if vid and item_id else None
-                        
-                        # Only add if it's a failed vehicle we need to retry
-                        if vehicle_key and vehicle_key in failed_vehicle_keys:
-                            merged_vehicles.append(vehicle)
-                        elif vehicle_key and vehicle_key not in [f"{v.get('vid')}_{v.get('item_id')}" for v in successful_vehicles if v.get('vid') and v.get('item_id')]:
-                            # New vehicle not in successful list
-                            merged_vehicles.append(vehicle)
-                    
-                    filtered_vehicles = merged_vehicles
-                else:
-                    # Only retry failed vehicles, keep successful ones
-                    filtered_vehicles = successful_vehicles.copy()
-                    for vehicle in existing_vehicles:
-                        vid = vehicle.get('vid')
-                        item_id = vehicle.get('item_id')
-                        vehicle_key = f"{vid}_{item_id}" if vid and item_id else None
-                        if vehicle_key and vehicle_key in failed_vehicle_keys:
-                            filtered_vehicles.append(vehicle)
-                
-                # Retry only failed vehicles (3 attempts each)
-                vehicles_to_retry = [v for v in filtered_vehicles if f"{v.get('vid')}_{v.get('item_id')}" in failed_vehicle_keys or not (v.get('vehicleimages') and len(v.get('vehicleimages', [])) > 0)]
-                
-                if vehicles_to_retry:
-                    logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] 🔄 Retrying {len(vehicles_to_retry)} failed vehicle(s)...")
-                    for vehicle_idx, vehicle in enumerate(vehicles_to_retry, 1):
-                        vid = vehicle.get('vid')
-                        item_id = vehicle.get('item_id')
-                        vehicle_link = vehicle.get('vehicle_link', '')
-                        reg = vehicle.get('registration_number', 'N/A')
-                        
-                        if not vid or not item_id:
-                            vehicle['vehicleimages'] = []
-                            continue
-                        
-                        logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(vehicles_to_retry)}] {reg} (VID: {vid})")
-                        
-                        # Retry logic for images (3 attempts)
-                        image_urls = []
-                        for img_retry in range(1, 4):
-                            try:
-                                html, image_urls = fetch_vehicle_detail_page(vehicle_link, vid, item_id, cookie, max_retries=3, auction_idx=auction_main_idx, total_auctions=len(auctions), vehicle_idx=vehicle_idx, total_vehicles=len(vehicles_to_retry), reg=reg)
-                                if image_urls and len(image_urls) > 0:
-                                    vehicle['vehicleimages'] = image_urls
-                                    # Update in filtered_vehicles list
-                                    for v in filtered_vehicles:
-                                        if v.get('vid') == vid and v.get('item_id') == item_id:
-                                            v['vehicleimages'] = image_urls
-                                    if img_retry > 1:
-                                        logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(vehicles_to_retry)}] {reg}: ✅ Found {len(image_urls)} images (retry {img_retry})")
-                                    break
-                                elif img_retry < 3:
-                                    logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(vehicles_to_retry)}] {reg}: ⚠️ No images (retry {img_retry}/3)")
-                                    time.sleep(2)
-                            except Exception:
-                                if img_retry < 3:
-                                    logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(vehicles_to_retry)}] {reg}: ⚠️ Error (retry {img_retry}/3)")
-                                    time.sleep(2)
-                                else:
-                                    vehicle['vehicleimages'] = []
-                                    logging.error(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(vehicles_to_retry)}] {reg}: ❌ Failed after 3 attempts")
-                        
-                        if not image_urls:
-                            vehicle['vehicleimages'] = []
-                            for v in filtered_vehicles:
-                                if v.get('vid') == vid and v.get('item_id') == item_id:
-                                    v['vehicleimages'] = []
-                            logging.warning(f"         [Auction: {auction_main_idx}/{len(auctions)}] | [Vehicle: {vehicle_idx}/{len(vehicles_to_retry)}] {reg}: ⚠️ No images found")
-                        
-                        time.sleep(1)
-                
-                # Calculate metrics
-                expected_vehicles_retry = vehicle_count
-                loaded_vehicles_retry = len(filtered_vehicles)
-                vehicles_with_data_retry = sum(1 for v in filtered_vehicles if v.get('registration_number') and v.get('make_model'))
-                vehicles_with_images_count_retry = sum(1 for v in filtered_vehicles if v.get('vehicleimages') and len(v.get('vehicleimages', [])) > 0)
-                
-                # Determine status
-                if loaded_vehicles_retry == 0 and expected_vehicles_retry > 0:
-                    status_retry = "timeout"
-                elif expected_vehicles_retry == loaded_vehicles_retry and filtered_vehicles and vehicles_with_images_count_retry == len(filtered_vehicles):
-                    status_retry = "complete"
-                elif filtered_vehicles and vehicles_with_images_count_retry == len(filtered_vehicles):
-                    status_retry = "complete"
-                elif filtered_vehicles:
-                    status_retry = "partial"
-                else:
-                    status_retry = "no_match"
-                
-                # Create summary
-                summary_retry = f"Status: {status_retry.upper()} - Expected: {expected_vehicles_retry}, Loaded: {loaded_vehicles_retry}, Filtered: {len(filtered_vehicles)}, With Data: {vehicles_with_data_retry}, With Images: {vehicles_with_images_count_retry}"
-                
-                # Update auction
-                old_status = auction.get('status')
-                auction['gj_vehicle_count'] = len(filtered_vehicles)
-                auction['vehicles'] = filtered_vehicles
-                auction['status'] = status_retry
-                auction['summary'] = summary_retry
-                
-                vehicles_with_images_count_retry = sum(1 for v in filtered_vehicles if v.get('vehicleimages') and len(v.get('vehicleimages', [])) > 0)
-                
-                if status_retry != old_status:
-                    retry_improved += 1
-                    logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] ✅ Status: {old_status} → {status_retry} | With Images: {vehicles_with_images_count_retry}/{len(filtered_vehicles)}")
-                else:
-                    logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] Status: {status_retry.upper()} | With Images: {vehicles_with_images_count_retry}/{len(filtered_vehicles)}")
-                
-                # Save progress
-                with open(paths_file, "w", encoding="utf-8") as f:
-                    json.dump(auctions, f, indent=4, ensure_ascii=False)
+                # Filter: Only Gujarat (GJ) vehicles with "With Papers" RC status
+                reloaded_vehicles = filter_gj_with_papers(extract_vehicle_links_from_auction_html(auction_html))
                 
-                time.sleep(2)
+                # Merge: keep vehicles that already have images, take the rest from the reload
+                filtered_vehicles = [v for v in existing_vehicles if v.get('vehicleimages')]
+                done_keys = {(v.get('vid'), v.get('item_id')) for v in filtered_vehicles}
+                filtered_vehicles.extend(v for v in reloaded_vehicles if (v.get('vid'), v.get('item_id')) not in done_keys)
+            else:
+                filtered_vehicles = existing_vehicles
             
-            logging.info(f"      ✅ Round {retry_round} complete: {retry_improved} auction(s) improved")
+            # Retry only vehicles still missing images
+            vehicles_to_retry = [v for v in filtered_vehicles if not v.get('vehicleimages')]
             
-            if not partial_failed_auctions:
-                break
+            if vehicles_to_retry:
+                logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] 🔄 Retrying {len(vehicles_to_retry)} failed vehicle(s)...")
+                fetch_images_for_vehicles(vehicles_to_retry, cookie, auction_main_idx, len(auctions), max_workers=browser_workers, indent="         ")
             
-            if retry_round < 3:
-                time.sleep(3)
+            # Calculate metrics
+            expected_vehicles_retry = vehicle_count
+            loaded_vehicles_retry = len(filtered_vehicles)
+            vehicles_with_data_retry, vehicles_with_images_count_retry = count_vehicle_progress(filtered_vehicles)
+            
+            # Determine status
+            if loaded_vehicles_retry == 0 and expected_vehicles_retry > 0:
+                status_retry = "timeout"
+            elif filtered_vehicles and vehicles_with_images_count_retry == len(filtered_vehicles):
+                status_retry = "complete"
+            elif filtered_vehicles:
+                status_retry = "partial"
+            else:
+                status_retry = "no_match"
+            
+            # Create summary
+            summary_retry = f"Status: {status_retry.upper()} - Expected: {expected_vehicles_retry}, Loaded: {loaded_vehicles_retry}, Filtered: {len(filtered_vehicles)}, With Data: {vehicles_with_data_retry}, With Images: {vehicles_with_images_count_retry}"
+            
+            # Update auction
+            auction['gj_vehicle_count'] = len(filtered_vehicles)
+            auction['vehicles'] = filtered_vehicles
+            auction['status'] = status_retry
+            auction['summary'] = summary_retry
+            
+            if status_retry != old_status:
+                retry_improved += 1
+                logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] ✅ Status: {old_status} → {status_retry} | With Images: {vehicles_with_images_count_retry}/{len(filtered_vehicles)}")
+            else:
+                logging.info(f"         [Auction: {auction_main_idx}/{len(auctions)}] Status: {status_retry.upper()} | With Images: {vehicles_with_images_count_retry}/{len(filtered_vehicles)}")
+            
+            # Save progress
+            save_auction_checkpoint(auction)
+        
+        save_auction_paths(paths_file, auctions)
+        logging.info(f"      ✅ Retry complete: {retry_improved} auction(s) improved")
     
     # After all retries, create "complete" versions of partial auctions with only successful vehicles
     logging.info("")
@@ -1543,8 +1813,7 @@ def update_auction_paths_with_vehicles():
     
     if complete_versions_created > 0:
         # Save updated auctions with complete versions
-        with open(paths_file, "w", encoding="utf-8") as f:
-            json.dump(auctions, f, indent=4, ensure_ascii=False)
+        save_auction_paths(paths_file, auctions)
         logging.info(f"   Created {complete_versions_created} complete version(s)")
     
     # Final summary
@@ -1563,6 +1832,7 @@ def update_auction_paths_with_vehicles():
         logging.info(f"   • Complete versions created: {complete_versions_created}")
     logging.info("")
     
+    BrowserPool.shutdown()
     return True
 
 
@@ -1577,8 +1847,10 @@ def download_cardekho_images():
     from concurrent.futures import ThreadPoolExecutor, as_completed
     
     load_dotenv()
+    configure_logging()
     date_folder = os.getenv("SCRAPE_START_DATE")
     image_count = int(os.getenv("IMAGE_COUNT", 30))
+    image_workers = max(1, int(os.getenv("IMAGE_DOWNLOAD_CONCURRENCY", 10)))
     
     if not date_folder:
         logging.error("SCRAPE_START_DATE not found in .env")
@@ -1593,8 +1865,7 @@ def download_cardekho_images():
     base_download_folder = os.path.join("downloads", date_folder)
     os.makedirs(base_download_folder, exist_ok=True)
     
-    with open(paths_file, "r", encoding="utf-8") as f:
-        auctions = json.load(f)
+    auctions = read_json(paths_file)
     
     # Filter only complete auctions
     complete_auctions = [a for a in auctions if a.get('status') == 'complete']
@@ -1614,125 +1885,144 @@ def download_cardekho_images():
     total_images_downloaded = 0
     
     def download_image(url, save_path, reg_no):
-        """Download a single image with proper URL handling."""
+        """
+        Download a single image with proper URL handling.
+        Returns True if this run wrote the file, False on failure, and None if the
+        file already existed (it is kept and not counted as downloaded).
+        """
         try:
-            # Handle URL encoding - CarDekho URLs may have spaces/special chars
-            # URLs are already clean from extraction, but handle edge cases
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36',
-                'Referer': 'https://auctions.cardekho.com/'
-            }
-            resp = requests.get(url, timeout=15, stream=True, headers=headers)
-            resp.raise_for_status()
-            with open(save_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Exclusive create: an image saved meanwhile (e.g. by a concurrent run) is
+            # kept rather than overwritten, and is never fetched a second time
+            # URLs are already clean from extraction
+            with open(save_path, "xb") as f, session.get(url, timeout=15, stream=True) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True  # Undo any Content-Encoding, as iter_content would
+                shutil.copyfileobj(resp.raw, f, 64 * 1024)
             return True
+        except FileExistsError:
+            return None
         except Exception as e:
+            # Don't leave a truncated file behind; it would be skipped as existing next run
+            if os.path.exists(save_path):
+                os.remove(save_path)
             logging.error(f"   ❌ Failed to download [{reg_no}]: {str(e)[:50]}")
             return False
     
-    for auction_idx, auction in enumerate(complete_auctions, 1):
-        auction_title = auction.get('title', 'Unknown')
-        auction_id = auction.get('auction_id', 'Unknown')
-        vehicles = auction.get('vehicles', [])
-        
-        if not vehicles:
-            continue
+    # One keep-alive session and one download pool for every image in the run,
+    # sized alike so worker threads never open throwaway connections to the CDN
+    with build_session({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36',
+        'Referer': 'https://auctions.cardekho.com/'
+    }, pool_size=image_workers) as session, ThreadPoolExecutor(max_workers=image_workers) as image_executor:
+        for auction_idx, auction in enumerate(complete_auctions, 1):
+            auction_title = auction.get('title', 'Unknown')
+            auction_id = auction.get('auction_id', 'Unknown')
+            vehicles = auction.get('vehicles', [])
+        
+            if not vehicles:
+                continue
         
-        logging.info(f"   Auction {auction_idx}/{len(complete_auctions)}: {auction_title} (ID: {auction_id}, {len(vehicles)} vehicles)")
+            logging.info(f"   Auction {auction_idx}/{len(complete_auctions)}: {auction_title} (ID: {auction_id}, {len(vehicles)} vehicles)")
         
-        for vehicle_idx, vehicle in enumerate(vehicles, 1):
-            reg_no_raw = vehicle.get('registration_number', '')
-            if not reg_no_raw:
-                continue
-            
-            # Sanitize registration number for folder name
-            reg_no = re.sub(r'[^A-Za-z0-9]', '_', reg_no_raw.strip().upper())
-            reg_folder = os.path.join(base_download_folder, reg_no)
-            images_folder = os.path.join(reg_folder, "images")
-            metadata_file = os.path.join(reg_folder, "metadata.txt")
-            
-            # Check if folder already exists with images and metadata
-            if os.path.exists(reg_folder) and os.path.exists(images_folder) and os.path.exists(metadata_file):
-                # Check if images folder has files
-                existing_images = [f for f in os.listdir(images_folder) if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
-                if existing_images:
-                    logging.info(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: Skipped (exists with {len(existing_images)} images)")
-                    skipped_vehicles += 1
+            for vehicle_idx, vehicle in enumerate(vehicles, 1):
+                reg_no_raw = vehicle.get('registration_number', '')
+                if not reg_no_raw:
                     continue
             
-            total_vehicles += 1
+                # Sanitize registration number for folder name
+                reg_no = REG_SANITIZE_RE.sub('_', reg_no_raw.strip().upper())
+                reg_folder = os.path.join(base_download_folder, reg_no)
+                images_folder = os.path.join(reg_folder, "images")
+                metadata_file = os.path.join(reg_folder, "metadata.txt")
             
-            # Create folders
-            os.makedirs(images_folder, exist_ok=True)
+                # One directory scan serves the skip check and the per-image existence test
+                if os.path.isdir(images_folder):
+                    existing_files = {entry.name for entry in os.scandir(images_folder)}
+                else:
+                    existing_files = set()
             
-            # Get image URLs
-            image_urls = vehicle.get('vehicleimages', [])
-            if not image_urls:
-                logging.warning(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: No images found")
-            else:
-                # Randomly select non-repetitive images
-                if len(image_urls) <= image_count:
-                    to_download = image_urls
+                # Check if folder already exists with images and metadata
+                if existing_files and os.path.exists(metadata_file):
+                    # Check if images folder has files
+                    existing_images = [name for name in existing_files if name.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
+                    if existing_images:
+                        logging.info(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: Skipped (exists with {len(existing_images)} images)")
+                        skipped_vehicles += 1
+                        continue
+            
+                total_vehicles += 1
+            
+                # Create folders
+                os.makedirs(images_folder, exist_ok=True)
+            
+                # Get image URLs
+                image_urls = vehicle.get('vehicleimages', [])
+                if not image_urls:
+                    logging.warning(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: No images found")
                 else:
-                    to_download = random.sample(image_urls, image_count)
+                    # Randomly select non-repetitive images
+                    if len(image_urls) <= image_count:
+                        to_download = image_urls
+                    else:
+                        to_download = random.sample(image_urls, image_count)
                 
-                logging.info(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: Downloading {len(to_download)}/{len(image_urls)} images")
+                    logging.info(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: Downloading {len(to_download)}/{len(image_urls)} images")
                 
-                # Download images concurrently (reduced logging)
-                images_downloaded = 0
-                failed_downloads = 0
-                with ThreadPoolExecutor(max_workers=10) as executor:
+                    # Download images concurrently (reduced logging)
+                    images_downloaded = 0
+                    failed_downloads = 0
                     futures = []
                     for idx, img_url in enumerate(to_download, 1):
                         # Extract file extension from URL
                         ext = os.path.splitext(img_url.split('?')[0])[1] or ".jpg"
-                        save_path = os.path.join(images_folder, f"{idx}{ext}")
-                        
-                        if os.path.exists(save_path):
+                        file_name = f"{idx}{ext}"
+                        if file_name in existing_files:
                             continue
-                        
-                        futures.append(executor.submit(download_image, img_url, save_path, reg_no))
                     
+                        save_path = os.path.join(images_folder, file_name)
+                        futures.append(image_executor.submit(download_image, img_url, save_path, reg_no))
+                
                     for future in as_completed(futures):
-                        if future.result():
+                        # None marks images another run saved meanwhile; they aren't counted either way
+                        result = future.result()
+                        if result:
                             images_downloaded += 1
-                        else:
+                        elif result is False:
                             failed_downloads += 1
-                    
+                
                     total_images_downloaded += images_downloaded
                     if failed_downloads > 0:
                         logging.warning(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: Downloaded {images_downloaded} images, {failed_downloads} failed")
                     else:
                         logging.info(f"      [{vehicle_idx}/{len(vehicles)}] {reg_no}: Downloaded {images_downloaded} images")
             
-            # Create metadata.txt
-            make_model = vehicle.get('make_model', 'N/A')
-            reg_number = vehicle.get('registration_number', 'N/A')
-            year = vehicle.get('manufacturing_year', 'N/A')
-            location = vehicle.get('location', 'N/A')
-            rc_status = vehicle.get('rc_status', 'N/A')
-            transmission = vehicle.get('transmission', 'N/A')
-            ownership = vehicle.get('ownership', 'N/A')
-            fuel_type = vehicle.get('fuel_type', 'N/A')
-            yard_name = vehicle.get('yard_name', 'N/A')
-            yard_location = vehicle.get('yard_location', 'N/A')
+                # Create metadata.txt
+                make_model = vehicle.get('make_model', 'N/A')
+                reg_number = vehicle.get('registration_number', 'N/A')
+                year = vehicle.get('manufacturing_year', 'N/A')
+                location = vehicle.get('location', 'N/A')
+                rc_status = vehicle.get('rc_status', 'N/A')
+                transmission = vehicle.get('transmission', 'N/A')
+                ownership = vehicle.get('ownership', 'N/A')
+                fuel_type = vehicle.get('fuel_type', 'N/A')
+                yard_name = vehicle.get('yard_name', 'N/A')
+                yard_location = vehicle.get('yard_location', 'N/A')
             
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                f.write(f"Title: {make_model}\n")
-                f.write(f"Registration Number: {reg_number}\n")
-                f.write(f"Manufacturing Year: {year}\n")
-                f.write(f"Location: {location}\n")
-                f.write(f"RC Status: {rc_status}\n")
-                f.write(f"Transmission: {transmission}\n")
-                f.write(f"Ownership: {ownership}\n")
-                f.write(f"Fuel Type: {fuel_type}\n")
-                f.write(f"Yard Name: {yard_name}\n")
-                f.write(f"Yard Location: {yard_location}\n")
-            
-            processed_vehicles += 1
+                with open(metadata_file, "w", encoding="utf-8") as f:
+                    f.write(
+                        f"Title: {make_model}\n"
+                        f"Registration Number: {reg_number}\n"
+                        f"Manufacturing Year: {year}\n"
+                        f"Location: {location}\n"
+                        f"RC Status: {rc_status}\n"
+                        f"Transmission: {transmission}\n"
+                        f"Ownership: {ownership}\n"
+                        f"Fuel Type: {fuel_type}\n"
+                        f"Yard Name: {yard_name}\n"
+                        f"Yard Location: {yard_location}\n"
+                    )
+            
+                processed_vehicles += 1
     
     logging.info("")
     logging.info("CARDEKHO IMAGE DOWNLOAD SUMMARY")
@@ -1750,6 +2040,7 @@ def scrape_cardekho_vehicles():
     Reads auction paths file (with vehicle links) and scrapes vehicle details.
     """
     load_dotenv()
+    configure_logging()
     cookie = os.getenv("CAR_DEKHO_COOKIE")
     
     if not cookie:
@@ -1767,8 +2058,7 @@ def scrape_cardekho_vehicles():
     logging.info("=" * 60)
     
     # Load auction paths with vehicle links
-    with open(paths_file, "r", encoding="utf-8") as f:
-        auctions = json.load(f)
+    auctions = read_json(paths_file)
     
     base_dir = "downloads/car_dekho"
     os.makedirs(base_dir, exist_ok=True)
@@ -1813,7 +2103,7 @@ def scrape_cardekho_vehicles():
                 continue
             
             # Sanitize registration number for folder name
-            reg_no = re.sub(r'[^A-Za-z0-9]', '_', details['registration'].strip().upper())
+            reg_no = REG_SANITIZE_RE.sub('_', details['registration'].strip().upper())
             
             # Create vehicle folder
             vehicle_dir = os.path.join(base_dir, reg_no)
@@ -1821,27 +2111,10 @@ def scrape_cardekho_vehicles():
             
             # Save metadata
             metadata_file = os.path.join(vehicle_dir, "metadata.txt")
+            lines = ["=== VEHICLE DETAILS ===", ""]
+            lines.extend(f"{label}: {value}" for label, key in VEHICLE_DETAIL_LABELS if (value := details.get(key)))
             with open(metadata_file, "w", encoding="utf-8") as f:
-                f.write("=== VEHICLE DETAILS ===\n\n")
-                
-                if details.get('make_model'):
-                    f.write(f"Make/Model: {details['make_model']}\n")
-                if details.get('registration'):
-                    f.write(f"Registration Number: {details['registration']}\n")
-                if details.get('year'):
-                    f.write(f"Manufacturing Year: {details['year']}\n")
-                if details.get('location'):
-                    f.write(f"Location: {details['location']}\n")
-                if details.get('paper_status'):
-                    f.write(f"Paper Status: {details['paper_status']}\n")
-                if details.get('rc_status'):
-                    f.write(f"RC Status: {details['rc_status']}\n")
-                if details.get('transmission'):
-                    f.write(f"Transmission: {details['transmission']}\n")
-                if details.get('ownership'):
-                    f.write(f"Ownership: {details['ownership']}\n")
-                if details.get('fuel_type'):
-                    f.write(f"Fuel Type: {details['fuel_type']}\n")
+                f.write("\n".join(lines) + "\n")
             
             logging.info(f"✅ Saved metadata for {reg_no}")
             successful_scrapes += 1
@@ -1857,6 +2130,7 @@ def scrape_cardekho_vehicles():
     logging.info(f"📁 Saved to: {base_dir}/")
     logging.info("=" * 60)
     
+    BrowserPool.shutdown()
     return True
 
 
@@ -9,27 +9,147 @@ Download images and metadata for GJ vehicles.
 """
 
 import os
-import re as _re
-import json
+import re
 import random
-import requests
 import logging
 import shutil
-import time
+import zipfile
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from scraper.log_setup import configure_logging
+from scraper.session import build_session
+from scraper.json_io import read_json
+from scraper.rate_limiter import RateLimiter
+
+BASE_URL = "https://www.cartradeexchange.com"
+
+# Registration number -> folder name (anything but ASCII letters/digits becomes _)
+REG_SANITIZE_RE = re.compile(r"[^A-Za-z0-9]")
+
+# HTML tags in the auction Title / itemTitle fields
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Detail page fields written to metadata.txt, as (label, key) in file order
+METADATA_LABELS = (
+    ('Power Steering', 'power_steering'),
+    ('Fuel Type', 'fuel_type'),
+    ('State', 'state'),
+    ('City', 'city'),
+    ('Yard Location', 'yard_location'),
+    ('Yard Name', 'yard_name'),
+    ('Payment Terms', 'payment_terms'),
+    ('RC Book Available', 'rc_book_available'),
+    ('Seller Reference', 'seller_reference'),
+    ('Sun Roof', 'sunroof'),
+    ('Manufacturing Year', 'manufacturing_year'),
+)
+
+# Detail page JS variables (`<js_var>:"value"`) -> output key, in metadata order
+JS_VARIABLE_KEYS = {
+    'auction_pw_steering': 'power_steering',
+    'auction_fuel': 'fuel_type',
+    'auction_state': 'state',
+    'auction_city': 'city',
+    'auction_yard_location': 'yard_location',
+    'auction_yard_name': 'yard_name',
+    'auction_payment_terms': 'payment_terms',
+    'auction_rcbook_available': 'rc_book_available',
+    'auction_seller_reference': 'seller_reference',
+    'auction_sunroof': 'sunroof',
+    'auction_odometer': 'odometer',
+    'auction_color': 'color',
+    'auction_shape': 'shape',
+    'auction_ageing': 'ageing',
+    'auction_delivery_dates': 'delivery_dates',
+    'auction_fuel_endors': 'fuel_endorsement',
+    'auction_regtype': 'registration_type',
+    'auction_regno': 'registration_number',
+    'auction_mfgymd': 'manufacturing_year',
+    'auction_reg_date': 'registration_date',
+    'auction_owner': 'owner_count',
+    'auction_insurance': 'insurance_type',
+    'auction_ins_exp': 'insurance_expiry',
+    'auction_claim_bonus': 'claim_bonus',
+    'auction_claim_percent': 'claim_percent',
+    'auction_hypo': 'hypothecation',
+    'auction_climate': 'climate_control',
+    'auction_doorcount': 'door_count',
+    'auction_gearbox': 'gearbox',
+    'auction_hypo_amount': 'hypo_amount',
+    'auction_bank_name': 'bank_name',
+    'auction_loan_off': 'loan_paid_off',
+    'auction_noc': 'noc_available',
+    'auction_chass_no': 'chassis_number',
+    'auction_eng_no': 'engine_number',
+    'vehicle_condition': 'vehicle_condition',
+    'fitness_validity': 'fitness_validity',
+    'client_contact_person_name': 'client_contact_person',
+    'client_contact_person_mobile': 'client_contact_mobile',
+    'buyer_fee_note': 'buyer_fee_note',
+    'rto_fine': 'rto_fine',
+    'repo_date': 'repo_date',
+    'parking_days': 'parking_days',
+    'parking_rate': 'parking_rate',
+    'parking_charges_approx': 'parking_charges_approx',
+}
+
+# One alternation over every wanted variable, so the page is scanned once
+JS_VARIABLE_RE = re.compile(
+    "(" + "|".join(map(re.escape, JS_VARIABLE_KEYS)) + r'):"([^"]*)"'
+)
+
+
+def download_image(session, url, save_path, reg_no):
+    """
+    Download a single image over the shared session (no logging on success for speed).
+    Returns True if this run wrote the file, False on failure, and None if the
+    file already existed (it is kept and not counted as downloaded).
+    """
+    try:
+        # Exclusive create: an image saved meanwhile (e.g. by a concurrent run) is
+        # kept rather than overwritten, and is never fetched a second time
+        with open(save_path, "xb") as f, session.get(url, timeout=15, stream=True) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True  # Undo any Content-Encoding, as iter_content would
+            shutil.copyfileobj(resp.raw, f, 64 * 1024)
+        return True
+    except FileExistsError:
+        return None
+    except Exception as e:
+        # Don't leave a truncated file behind; it would be skipped as existing next run
+        if os.path.exists(save_path):
+            os.remove(save_path)
+        logging.error(f"   ❌ Failed to download [{reg_no}]: {str(e)[:50]}")
+        return False
 
 
-def download_image(url, save_path, reg_no):
-    """Download a single image (no logging on success for speed)."""
+def copy_downloaded_image(source_future, source_path, session, url, save_path, reg_no):
+    """
+    Reuse an image already downloaded earlier in this run instead of fetching
+    the same URL again. Waits for the original download, then hardlinks it
+    (or copies it where hardlinks aren't supported). Returns like download_image.
+    """
+    source_result = source_future.result()
+    if source_result is None:
+        # The original was a file this run didn't write (another run may still
+        # be writing it), so fetch this copy normally instead of linking it
+        return download_image(session, url, save_path, reg_no)
+    if not source_result:
+        return False
     try:
-        resp = requests.get(url, timeout=15)
-        resp.raise_for_status()
-        with open(save_path, "wb") as f:
-            f.write(resp.content)
+        try:
+            os.link(source_path, save_path)
+        except FileExistsError:
+            raise
+        except OSError:
+            # No hardlinks here; copy instead, still without overwriting
+            with open(source_path, "rb") as src, open(save_path, "xb") as dst:
+                shutil.copyfileobj(src, dst, 64 * 1024)
         return True
+    except FileExistsError:
+        return None
     except Exception as e:
-        logging.error(f"   ❌ Failed to download [{reg_no}]: {str(e)[:50]}")
+        logging.error(f"   ❌ Failed to copy image [{reg_no}]: {str(e)[:50]}")
         return False
 
 
@@ -37,78 +157,34 @@ def extract_js_variables(html_content):
     """Extract JavaScript variables from HTML content."""
     details = {}
     
-    # Patterns to extract specific variables
-    patterns = {
-        'power_steering': r'auction_pw_steering:"([^"]*)"',
-        'fuel_type': r'auction_fuel:"([^"]*)"',
-        'state': r'auction_state:"([^"]*)"',
-        'city': r'auction_city:"([^"]*)"',
-        'yard_location': r'auction_yard_location:"([^"]*)"',
-        'yard_name': r'auction_yard_name:"([^"]*)"',
-        'payment_terms': r'auction_payment_terms:"([^"]*)"',
-        'rc_book_available': r'auction_rcbook_available:"([^"]*)"',
-        'seller_reference': r'auction_seller_reference:"([^"]*)"',
-        'sunroof': r'auction_sunroof:"([^"]*)"',
-        'odometer': r'auction_odometer:"([^"]*)"',
-        'color': r'auction_color:"([^"]*)"',
-        'shape': r'auction_shape:"([^"]*)"',
-        'ageing': r'auction_ageing:"([^"]*)"',
-        'delivery_dates': r'auction_delivery_dates:"([^"]*)"',
-        'fuel_endorsement': r'auction_fuel_endors:"([^"]*)"',
-        'registration_type': r'auction_regtype:"([^"]*)"',
-        'registration_number': r'auction_regno:"([^"]*)"',
-        'manufacturing_year': r'auction_mfgymd:"([^"]*)"',
-        'registration_date': r'auction_reg_date:"([^"]*)"',
-        'owner_count': r'auction_owner:"([^"]*)"',
-        'insurance_type': r'auction_insurance:"([^"]*)"',
-        'insurance_expiry': r'auction_ins_exp:"([^"]*)"',
-        'claim_bonus': r'auction_claim_bonus:"([^"]*)"',
-        'claim_percent': r'auction_claim_percent:"([^"]*)"',
-        'hypothecation': r'auction_hypo:"([^"]*)"',
-        'climate_control': r'auction_climate:"([^"]*)"',
-        'door_count': r'auction_doorcount:"([^"]*)"',
-        'gearbox': r'auction_gearbox:"([^"]*)"',
-        'hypo_amount': r'auction_hypo_amount:"([^"]*)"',
-        'bank_name': r'auction_bank_name:"([^"]*)"',
-        'loan_paid_off': r'auction_loan_off:"([^"]*)"',
-        'noc_available': r'auction_noc:"([^"]*)"',
-        'chassis_number': r'auction_chass_no:"([^"]*)"',
-        'engine_number': r'auction_eng_no:"([^"]*)"',
-        'vehicle_condition': r'vehicle_condition:"([^"]*)"',
-        'fitness_validity': r'fitness_validity:"([^"]*)"',
-        'client_contact_person': r'client_contact_person_name:"([^"]*)"',
-        'client_contact_mobile': r'client_contact_person_mobile:"([^"]*)"',
-        'buyer_fee_note': r'buyer_fee_note:"([^"]*)"',
-        'rto_fine': r'rto_fine:"([^"]*)"',
-        'repo_date': r'repo_date:"([^"]*)"',
-        'parking_days': r'parking_days:"([^"]*)"',
-        'parking_rate': r'parking_rate:"([^"]*)"',
-        'parking_charges_approx': r'parking_charges_approx:"([^"]*)"',
-    }
+    # First occurrence of each variable wins, as a per-variable search would find
+    found = {}
+    for match in JS_VARIABLE_RE.finditer(html_content):
+        found.setdefault(match.group(1), match.group(2))
     
-    for key, pattern in patterns.items():
-        match = _re.search(pattern, html_content)
-        if match:
-            value = match.group(1).strip()
-            if value:  # Only add non-empty values
-                details[key] = value
+    for js_var, key in JS_VARIABLE_KEYS.items():
+        value = found.get(js_var, '').strip()
+        if value:  # Only add non-empty values
+            details[key] = value
     
     return details
 
 
-def fetch_detail_page(detail_link, cookie):
-    """Fetch detail page HTML content."""
-    base_url = "https://www.cartradeexchange.com"
-    full_url = base_url + detail_link
-    
-    headers = {
+def build_detail_session(cookie, pool_size=4):
+    """Build the keep-alive session used for every detail page fetch in a run."""
+    return build_session({
         'Cookie': cookie,
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36',
         'Referer': 'https://www.cartradeexchange.com/Events-Live'
-    }
+    }, pool_size=pool_size)
+
+
+def fetch_detail_page(session, detail_link):
+    """Fetch detail page HTML content over the shared detail session."""
+    full_url = BASE_URL + detail_link
     
     try:
-        response = requests.get(full_url, headers=headers, timeout=30)
+        response = session.get(full_url, timeout=30)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -116,24 +192,22 @@ def fetch_detail_page(detail_link, cookie):
         return None
 
 
+def fetch_detail_info(session, detail_link, limiter=None):
+    """Fetch a detail page (paced by the shared rate limiter) and extract its JS variables."""
+    if limiter:
+        limiter.acquire()
+    html_content = fetch_detail_page(session, detail_link)
+    return extract_js_variables(html_content) if html_content else {}
+
+
 def download_gj_images():
     """Main function to download images and generate metadata for GJ vehicles."""
     load_dotenv()  # Load SCRAPE_START_DATE & IMAGE_COUNT
-
-    if not logging.getLogger().hasHandlers():
-        os.makedirs("logs", exist_ok=True)
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s | %(levelname)s | %(message)s",
-            handlers=[
-                logging.FileHandler("logs/scraper.log", encoding="utf-8"),
-                logging.StreamHandler()
-            ],
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+    configure_logging()
 
     date_folder = os.getenv("SCRAPE_START_DATE")
     image_count = int(os.getenv("IMAGE_COUNT", 30))
+    image_workers = max(1, int(os.getenv("IMAGE_DOWNLOAD_CONCURRENCY", 10)))
     cookie = os.getenv("CAR_TRADE_COOKIE", "")
 
     if not date_folder:
@@ -151,20 +225,24 @@ def download_gj_images():
         logging.error(f"{gj_file} not found. Run previous scraper first.")
         return
 
-    with open(gj_file, "r", encoding="utf-8") as f:
-        auctions = json.load(f)
+    auctions = read_json(gj_file)
 
     logging.info(f"Processing {len(auctions)} GJ vehicles for image download & metadata.")
+    # Detail pages are fetched in parallel, paced by a token bucket instead of a fixed sleep
+    detail_workers = max(1, int(os.getenv("SCRAPE_CONCURRENCY", 8)))
+    limiter = RateLimiter(float(os.getenv("SCRAPE_RATE_LIMIT", 5)))
+    pending_downloads = []  # (vehicle number, folder name, futures)
+    pending_metadata = []  # (vehicle folder, auction, raw_reg, detail page future)
+    first_downloads = {}  # image URL -> (future, save path) of its first download this run
     logging.info("")
     seen_registrations = set()
-    valid_count = 0
     total_images_downloaded = 0
     metadata_enhanced = 0
     total_vehicles = len(auctions)
-    current_vehicle = 0
 
-    for auction in auctions:
-        current_vehicle += 1
+    # Pass 1: resolve and deduplicate each vehicle's folder name
+    vehicles_to_process = []  # (vehicle number, auction, raw_reg, folder name)
+    for current_vehicle, auction in enumerate(auctions, 1):
         raw_reg = auction.get("registrationNumber")
         auction_id = auction.get("auctionId", "?")
         sellerRef = auction.get("sellerRef", "?")
@@ -179,7 +257,8 @@ def download_gj_images():
 
         if len(raw_reg) < 6:
             logging.warning(f"[WARN] Found auctionId={auction_id} invalid registrationNumber={raw_reg}")
-            if len(sellerRef) > 6 and sellerRef.startswith("GJ"):
+            # sellerRef can be null in the feed; check the type before measuring it
+            if isinstance(sellerRef, str) and len(sellerRef) > 6 and sellerRef.startswith("GJ"):
                 logging.info(f"  Using sellerRef={sellerRef} instead of registrationNumber")
                 raw_reg = sellerRef
                 fallback_used = True
@@ -190,7 +269,7 @@ def download_gj_images():
                 raw_reg = raw_reg or "UNKNOWN"
 
         # Sanitize registration number
-        reg_no = _re.sub(r"[^A-Za-z0-9]", "_", raw_reg.strip().upper())
+        reg_no = REG_SANITIZE_RE.sub("_", raw_reg.strip().upper())
 
         # Folder naming logic
         if both_invalid:
@@ -203,110 +282,102 @@ def download_gj_images():
             logging.warning(f"[WARN] Skipped duplicate folder={folder_name} auctionId={auction_id}")
             continue
         seen_registrations.add(folder_name)
-
-        valid_count += 1
-        reg_folder = os.path.join(base_download_folder, folder_name)
-        images_folder = os.path.join(reg_folder, "images")
-        os.makedirs(images_folder, exist_ok=True)
-
-        # Get image URLs
-        image_urls = auction.get("imageUrls", [])
-        if not image_urls:
-            logging.warning(f"   [{current_vehicle}/{total_vehicles}] {folder_name}: No images found")
-            continue
-
-        # Selection logic
-        if len(image_urls) <= image_count:
-            to_download = image_urls
-        else:
-            to_download = random.sample(image_urls, image_count)
+        vehicles_to_process.append((current_vehicle, auction, raw_reg, folder_name))
+
+    # Create every vehicle folder in one batch, outside the download loop
+    for _, _, _, folder_name in vehicles_to_process:
+        os.makedirs(os.path.join(base_download_folder, folder_name, "images"), exist_ok=True)
+
+    # One keep-alive pool and one worker pool for every image in the run, so
+    # downloads overlap across vehicles (and with the detail page fetches).
+    # Leaving the block waits for queued work and closes the sessions, even on error.
+    with build_session(pool_size=image_workers) as image_session, \
+            ThreadPoolExecutor(max_workers=image_workers) as image_executor, \
+            build_detail_session(cookie, pool_size=detail_workers) as detail_session, \
+            ThreadPoolExecutor(max_workers=detail_workers) as detail_executor:
+        # Pass 2: queue image downloads and write metadata
+        valid_count = len(vehicles_to_process)
+        for current_vehicle, auction, raw_reg, folder_name in vehicles_to_process:
+            reg_folder = os.path.join(base_download_folder, folder_name)
+            images_folder = os.path.join(reg_folder, "images")
+
+            # Get image URLs
+            image_urls = auction.get("imageUrls", [])
+            if not image_urls:
+                logging.warning(f"   [{current_vehicle}/{total_vehicles}] {folder_name}: No images found")
+                continue
+
+            # Selection logic
+            if len(image_urls) <= image_count:
+                to_download = image_urls
+            else:
+                to_download = random.sample(image_urls, image_count)
         
-        logging.info(f"   [{current_vehicle}/{total_vehicles}] {folder_name}: Downloading {len(to_download)}/{len(image_urls)} images")
+            logging.info(f"   [{current_vehicle}/{total_vehicles}] {folder_name}: Downloading {len(to_download)}/{len(image_urls)} images")
+
+            # One directory scan instead of an os.path.exists() call per image
+            existing_files = {entry.name for entry in os.scandir(images_folder)}
 
-        # Download concurrently (reduced logging)
-        failed_downloads = 0
-        with ThreadPoolExecutor(max_workers=10) as executor:
+            # Queue downloads on the shared pool; results are tallied after the loop
             futures = []
-            images_downloaded = 0
             for idx, img_url in enumerate(to_download, 1):
                 ext = os.path.splitext(img_url)[1].split("?")[0] or ".jpg"
-                save_path = os.path.join(images_folder, f"{idx}{ext}")
-
-                if os.path.exists(save_path):
+                file_name = f"{idx}{ext}"
+                if file_name in existing_files:
                     continue
 
-                futures.append(executor.submit(download_image, img_url, save_path, folder_name))
-            
-            for future in as_completed(futures):
-                if future.result():
-                    images_downloaded += 1
-                else:
-                    failed_downloads += 1
-
+                save_path = os.path.join(images_folder, file_name)
+                # Relisted vehicles and stock photos repeat URLs; fetch each one once
+                if img_url in first_downloads:
+                    source_future, source_path = first_downloads[img_url]
+                    futures.append(image_executor.submit(copy_downloaded_image, source_future, source_path, image_session, img_url, save_path, folder_name))
+                    continue
+                future = image_executor.submit(download_image, image_session, img_url, save_path, folder_name)
+                first_downloads[img_url] = (future, save_path)
+                futures.append(future)
+            pending_downloads.append((current_vehicle, folder_name, futures))
+
+            # Queue the detail page fetch if cookie is available; metadata is written once it lands
+            detail_future = None
+            if cookie and auction.get('detailLink'):
+                detail_future = detail_executor.submit(fetch_detail_info, detail_session, auction.get('detailLink'), limiter)
+            pending_metadata.append((reg_folder, auction, raw_reg, detail_future))
+
+        # Write metadata as the detail pages come in
+        for reg_folder, auction, raw_reg, detail_future in pending_metadata:
+            detailed_info = detail_future.result() if detail_future else {}
+            if detailed_info:
+                metadata_enhanced += 1
+        
+            # Build metadata in memory and write it in one call
+            lines = []
+            # Add Title and itemTitle from JSON data first (HTML tags removed)
+            if title := auction.get('Title'):
+                lines.append(f"Title: {HTML_TAG_RE.sub('', title).strip()}")
+            if item_title := auction.get('itemTitle'):
+                lines.append(f"Item Title: {HTML_TAG_RE.sub('', item_title).strip()}")
+        
+            # Add the requested fields from detailed scraping, with readable labels
+            lines.extend(f"{label}: {detailed_info[key]}" for label, key in METADATA_LABELS if key in detailed_info)
+        
+            # Add registration number from JSON
+            lines.append(f"Registration Number: {raw_reg}")
+        
+            metadata_file = os.path.join(reg_folder, "metadata.txt")
+            with open(metadata_file, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+        # Wait for the queued downloads and report per vehicle
+        for vehicle_number, folder_name, futures in pending_downloads:
+            # None marks images another run saved meanwhile; they aren't counted either way
+            results = [future.result() for future in futures]
+            images_downloaded = results.count(True)
+            failed_downloads = results.count(False)
             total_images_downloaded += images_downloaded
             if failed_downloads > 0:
-                logging.warning(f"   [{current_vehicle}/{total_vehicles}] {folder_name}: Downloaded {images_downloaded} images, {failed_downloads} failed")
+                logging.warning(f"   [{vehicle_number}/{total_vehicles}] {folder_name}: Downloaded {images_downloaded} images, {failed_downloads} failed")
             else:
-                logging.info(f"   [{current_vehicle}/{total_vehicles}] {folder_name}: Downloaded {images_downloaded} images")
-
-        # Extract detailed metadata from detail page if cookie is available
-        detailed_info = {}
-        if cookie and auction.get('detailLink'):
-            detail_link = auction.get('detailLink')
-            html_content = fetch_detail_page(detail_link, cookie)
-            if html_content:
-                detailed_info = extract_js_variables(html_content)
-                if detailed_info:
-                    metadata_enhanced += 1
-            time.sleep(2)
-        
-        # Add Title and itemTitle from JSON data to detailed_info (clean HTML tags)
-        if auction.get('Title'):
-            # Remove HTML tags from Title
-            clean_title = _re.sub(r'<[^>]+>', '', auction.get('Title'))
-            detailed_info['title'] = clean_title.strip()
-        if auction.get('itemTitle'):
-            # Remove HTML tags from itemTitle
-            clean_item_title = _re.sub(r'<[^>]+>', '', auction.get('itemTitle'))
-            detailed_info['item_title'] = clean_item_title.strip()
-
-        # Write metadata
-        metadata_file = os.path.join(reg_folder, "metadata.txt")
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            # Write only the specific fields requested          
-            # Add Title and itemTitle first
-            if 'title' in detailed_info:
-                f.write(f"Title: {detailed_info['title']}\n")
-            if 'item_title' in detailed_info:
-                f.write(f"Item Title: {detailed_info['item_title']}\n")
-            
-            # Add specific fields from detailed scraping
-            if detailed_info:
-                # Map our extracted keys to readable labels for only the requested fields
-                label_mapping = {
-                    'power_steering': 'Power Steering',
-                    'fuel_type': 'Fuel Type',
-                    'state': 'State',
-                    'city': 'City',
-                    'yard_location': 'Yard Location',
-                    'yard_name': 'Yard Name',
-                    'payment_terms': 'Payment Terms',
-                    'rc_book_available': 'RC Book Available',
-                    'seller_reference': 'Seller Reference',
-                    'sunroof': 'Sun Roof',
-                    'manufacturing_year': 'Manufacturing Year',
-                }
-                
-                # Track which fields we've written to avoid duplicates
-                written_fields = set()
-                
-                for key, value in detailed_info.items():
-                    if key in label_mapping and key not in written_fields:
-                        f.write(f"{label_mapping[key]}: {value}\n")
-                        written_fields.add(key)
-            
-            # Add registration number from JSON
-            f.write(f"Registration Number: {raw_reg}\n")
+                logging.info(f"   [{vehicle_number}/{total_vehicles}] {folder_name}: Downloaded {images_downloaded} images")
 
     logging.info("")
     logging.info("CARTRADE IMAGE DOWNLOAD SUMMARY")
@@ -337,11 +408,10 @@ def create_date_zip(date_folder: str | None = None) -> str | None:
             logging.error(f"create_date_zip: source folder does not exist: {src_dir}")
             return None
 
-        # Destination zip path: downloads/<date_folder>.zip (shutil will append .zip)
-        base_name = os.path.join("downloads", date_folder)
+        # Destination zip path: downloads/<date_folder>.zip
+        zip_path = os.path.join("downloads", date_folder) + ".zip"
 
         # If an existing zip exists, overwrite it by removing first
-        zip_path = base_name + ".zip"
         if os.path.exists(zip_path):
             try:
                 os.remove(zip_path)
@@ -349,10 +419,19 @@ def create_date_zip(date_folder: str | None = None) -> str | None:
                 logging.warning(f"Could not remove existing zip {zip_path}: {e}")
 
         logging.info(f"Creating zip archive for {src_dir} -> {zip_path} ...")
-        # shutil.make_archive returns the actual archive path
-        archive = shutil.make_archive(base_name, 'zip', root_dir=src_dir)
-        logging.info(f"Created archive: {archive}")
-        return archive
+        # Store entries uncompressed: the archive is almost all JPEGs, which
+        # DEFLATE (shutil.make_archive's default) burns CPU on for no size gain
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for root, dirs, files in os.walk(src_dir):
+                dirs.sort()
+                for name in dirs:
+                    path = os.path.join(root, name)
+                    zf.write(path, os.path.relpath(path, src_dir))  # Keeps empty folders
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    zf.write(path, os.path.relpath(path, src_dir))
+        logging.info(f"Created archive: {zip_path}")
+        return zip_path
     except Exception as e:
         logging.exception(f"Failed to create date zip: {e}")
         return None
@@ -9,36 +9,48 @@ and extracts eventId + bidNowPath (cartrade_event_paths.json).
 """
 
 import os
-import json
+import re
 import logging
-from datetime import datetime
+from datetime import date, datetime
 import requests
+from urllib3.util.request import ACCEPT_ENCODING
 from dotenv import load_dotenv
-
-# === Logging Setup ===
-os.makedirs("logs", exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-    handlers=[
-        logging.FileHandler("logs/scraper.log", encoding="utf-8"),
-        logging.StreamHandler()
-    ],
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+from scraper.log_setup import configure_logging
+from scraper.json_io import read_json, write_json
 
 BASE_URL = "https://www.cartradeexchange.com/Events-Live/"
 
+# eventEndDateTime in its usual form, e.g. "14-Oct-2025 14:06"
+EVENT_END_RE = re.compile(r"([0-9]{1,2})-([A-Z][a-z]{2})-([0-9]{4}) (?:[01][0-9]|2[0-3]):[0-5][0-9]")
+MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def parse_event_end_date(end_str):
+    """
+    Return the date of an eventEndDateTime string like "14-Oct-2025 14:06".
+    The usual form is parsed by hand (strptime is slow and locale-aware);
+    anything else falls back to strptime, which accepts or rejects it as before.
+    """
+    match = EVENT_END_RE.fullmatch(end_str)
+    if match and match.group(2) in MONTHS:
+        return date(int(match.group(3)), MONTHS[match.group(2)], int(match.group(1)))
+    return datetime.strptime(end_str, "%d-%b-%Y %H:%M").date()
+
 
 def fetch_live_events():
     """Fetches live events and saves them as downloads/cartrade_events_raw.json."""
     load_dotenv()
+    configure_logging()
     cookie = os.getenv("CAR_TRADE_COOKIE")
     if not cookie:
         raise ValueError("CAR_TRADE_COOKIE not found in .env file")
 
     headers = {
         "Content-Type": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Cookie": cookie,
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -73,8 +85,7 @@ def fetch_live_events():
         os.makedirs("downloads", exist_ok=True)
         filename = "downloads/cartrade_events_raw.json"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(events, f, indent=4, ensure_ascii=False)
+        write_json(filename, events)
 
         logging.info(f"Saved {len(events)} events to {filename}")
         return filename
@@ -96,6 +107,7 @@ def filter_insurance_events(raw_file):
     Also extracts [eventId, bidNowPath] into downloads/cartrade_event_paths.json.
     """
     load_dotenv()
+    configure_logging()
     target_date_str = os.getenv("SCRAPE_START_DATE")
 
     if not target_date_str:
@@ -112,8 +124,7 @@ def filter_insurance_events(raw_file):
 
     logging.info("Filtering events for category ID 5 and date %s", target_date)
 
-    with open(raw_file, "r", encoding="utf-8") as f:
-        events = json.load(f)
+    events = read_json(raw_file)
 
     filtered = []
     bid_path_data = []
@@ -125,7 +136,7 @@ def filter_insurance_events(raw_file):
 
             # Parse event date string like "14-Oct-2025 14:06"
             end_str = ev.get("eventEndDateTime")
-            end_date = datetime.strptime(end_str, "%d-%b-%Y %H:%M").date()
+            end_date = parse_event_end_date(end_str)
 
             if end_date == target_date:
                 filtered.append(ev)
@@ -144,13 +155,11 @@ def filter_insurance_events(raw_file):
 
     # Save filtered full data
     filtered_file = "downloads/cartrade_events_insurance.json"
-    with open(filtered_file, "w", encoding="utf-8") as f:
-        json.dump(filtered, f, indent=4, ensure_ascii=False)
+    write_json(filtered_file, filtered)
 
     # Save compact bid path array
     bid_file = "downloads/cartrade_event_paths.json"
-    with open(bid_file, "w", encoding="utf-8") as f:
-        json.dump(bid_path_data, f, indent=4, ensure_ascii=False)
+    write_json(bid_file, bid_path_data)
 
     logging.info(f"Filtered {len(filtered)} insurance events for {target_date}.")
     logging.info(f"Saved filtered data to {filtered_file}")
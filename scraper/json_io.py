@@ -0,0 +1,62 @@
+"""
+json_io.py
+----------
+orjson-backed helpers for reading and writing the pipeline's JSON files.
+orjson (Rust) is several times faster than the stdlib json module on both
+decode and encode, and writes UTF-8 bytes directly.
+"""
+
+import os
+import mmap
+import orjson
+
+
+def read_json(path):
+    """
+    Load a JSON file. The file is memory-mapped and parsed in place, so large
+    files (e.g. the CarDekho dashboard) are not first copied into a bytes object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")  # Raises JSONDecodeError like an empty read would
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+
+def write_json(path, data, indent=True):
+    """
+    Write data to a JSON file (UTF-8; 2-space indented unless indent=False).
+    The file is replaced atomically (temp file + os.replace), so an interrupted
+    write leaves the previous contents intact instead of a truncated file.
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def json_line(record):
+    """Serialize one record as a JSON Lines row (bytes, newline-terminated)."""
+    return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def read_json_lines(path):
+    """Yield (raw_line, record) pairs from a JSON Lines file."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield line, orjson.loads(line)
+
+
+def write_json_lines(path, records):
+    """Write records as JSON Lines atomically (temp file + os.replace)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        for record in records:
+            f.write(json_line(record))
+    os.replace(tmp_path, path)
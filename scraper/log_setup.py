@@ -0,0 +1,37 @@
+"""
+log_setup.py
+------------
+Single place to configure logging for every scraper module.
+configure_logging() is idempotent: the first call attaches the handlers,
+later calls are no-ops, so log lines are never duplicated no matter how
+many steps (or threads) call it.
+"""
+
+import os
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+
+LOG_FILE = "logs/scraper.log"
+
+_lock = threading.Lock()
+
+
+def configure_logging():
+    """Attach the shared file + console handlers to the root logger (once)."""
+    with _lock:
+        root = logging.getLogger()
+        if root.handlers:
+            return
+
+        os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s | %(levelname)s | %(message)s",
+            handlers=[
+                # Bounded log size: 50 MB x 5 backups
+                RotatingFileHandler(LOG_FILE, maxBytes=50 << 20, backupCount=5, encoding="utf-8"),
+                logging.StreamHandler()
+            ],
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
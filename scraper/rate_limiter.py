@@ -0,0 +1,41 @@
+"""
+rate_limiter.py
+---------------
+Thread-safe token-bucket rate limiter used to pace requests across worker
+threads. It replaces fixed time.sleep() delays: requests go out as fast as
+the configured rate allows, and workers only wait once the bucket is empty.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per second on average,
+    with bursts of up to `burst` acquisitions.
+    A rate of 0 (or less) disables limiting.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,63 @@
+"""
+session.py
+----------
+Shared requests.Session factory for the scrapers.
+Reuses keep-alive connections (one TCP + TLS handshake per host instead of
+one per request), requests compressed responses, and retries transient
+failures (429/5xx) with backoff. Optionally caches GET responses on disk
+(requests-cache) so re-runs and retries skip repeated page fetches.
+"""
+
+import os
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+
+HTTP_CACHE_FILE = os.path.join("downloads", "http_cache.sqlite")
+
+
+def build_session(headers=None, pool_size=16, cache_ttl=0):
+    """
+    Build a requests.Session with a pooled, retrying HTTPAdapter.
+
+    Args:
+        headers (dict): Default headers sent with every request
+        pool_size (int): Max connections kept open per host
+        cache_ttl (int): If > 0, cache GET responses in downloads/http_cache.sqlite
+            for this many seconds (POSTs are never cached)
+
+    Returns:
+        requests.Session: Configured session
+    """
+    if cache_ttl > 0:
+        os.makedirs(os.path.dirname(HTTP_CACHE_FILE), exist_ok=True)
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_FILE,
+            backend="sqlite",
+            expire_after=cache_ttl,
+            allowable_methods=("GET",),
+            cache_control=True  # Honor Cache-Control: no-store from the server
+        )
+        session.cache.delete(expired=True)
+    else:
+        session = requests.Session()
+    # Advertise every encoding urllib3 can decode here (gzip/deflate, plus
+    # br and zstd when brotli/zstandard are installed)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    if headers:
+        session.headers.update(headers)
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,  # Back off as long as the server asks on 429/503
+        allowed_methods=None  # Also retry POST (all our POSTs are read-only queries)
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session